@@ -0,0 +1,90 @@
+"""
+asyncio message throughput benchmark
+
+Moves a fixed number of messages from many producer coroutines to many
+consumer coroutines through asyncio.Queue, dstlib.AsyncQueue (get and
+get_batch) and dstlib.AsyncStack.
+
+Usage: python benchmarks/async_throughput.py [number_of_messages] [coroutines_per_side]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+BATCH = 64
+
+
+async def _run(Q, put, get, n, coroutines):
+    """Run coroutines producers and consumers over n messages and return the elapsed seconds"""
+    per_producer = n // coroutines
+    total = per_producer * coroutines
+    received = 0
+    done = asyncio.Event()
+
+    async def produce():
+        for i in range(per_producer):
+            await put(Q, i)
+
+    async def consume():
+        nonlocal received
+        while received < total:
+            received += await get(Q)
+            if received >= total:
+                done.set()
+
+    start = time.perf_counter()
+    consumers = [asyncio.ensure_future(consume()) for _ in range(coroutines)]
+    await asyncio.gather(*[produce() for _ in range(coroutines)])
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    for c in consumers:
+        c.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    return total / elapsed
+
+
+async def _queue_put(Q, el):
+    await Q.put(el)
+
+
+async def _queue_get(Q):
+    await Q.get()
+    return 1
+
+
+async def _queue_get_batch(Q):
+    return len(await Q.get_batch(BATCH))
+
+
+async def _stack_push(S, el):
+    await S.push(el)
+
+
+async def _stack_pop(S):
+    await S.pop()
+    return 1
+
+
+CASES = [
+    ("asyncio.Queue", asyncio.Queue, _queue_put, _queue_get),
+    ("AsyncQueue get", dstlib.AsyncQueue, _queue_put, _queue_get),
+    ("AsyncQueue get_batch", dstlib.AsyncQueue, _queue_put, _queue_get_batch),
+    ("AsyncStack", dstlib.AsyncStack, _stack_push, _stack_pop),
+]
+
+
+def main(n=200000, coroutines=100):
+    print("%-22s %12s" % ("structure", "messages/s"))
+    for name, factory, put, get in CASES:
+        async def case():
+            return await _run(factory(maxsize=1000), put, get, n, coroutines)
+        print("%-22s %12.0f" % (name, asyncio.run(case())))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
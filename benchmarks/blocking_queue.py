@@ -0,0 +1,89 @@
+"""
+Blocking queue contention benchmark
+
+Moves a fixed number of items from several producer threads to several
+consumer threads through queue.Queue and dstlib.BlockingQueue, with single
+element put/get and with batched put_many/get_many.
+
+Usage: python benchmarks/blocking_queue.py [number_of_items] [threads_per_side]
+"""
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+BATCH = 64
+_STOP = object()
+
+
+def _run(producer, consumer, finish, Q, n, threads):
+    """Run threads producers and threads consumers over n items and return the elapsed seconds"""
+    per_producer = n // threads
+    workers = [threading.Thread(target=producer, args=(Q, per_producer)) for _ in range(threads)]
+    workers += [threading.Thread(target=consumer, args=(Q,)) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers[:threads]:
+        w.join()
+    finish(Q, threads)
+    for w in workers[threads:]:
+        w.join()
+    return time.perf_counter() - start
+
+
+def _single_producer(Q, count):
+    put = Q.put
+    for i in range(count):
+        put(i)
+
+
+def _single_consumer(Q):
+    get = Q.get
+    while get() is not _STOP:
+        pass
+
+
+def _batch_producer(Q, count):
+    for start in range(0, count, BATCH):
+        Q.put_many(range(start, min(start + BATCH, count)))
+
+
+def _batch_consumer(Q):
+    try:
+        while True:
+            Q.get_many(BATCH)
+    except dstlib.Closed:
+        return
+
+
+def _stop_each(Q, threads):
+    for _ in range(threads):
+        Q.put(_STOP)
+
+
+def _close(Q, threads):
+    Q.close()
+
+
+CASES = [
+    ("queue.Queue put/get", lambda: queue.Queue(maxsize=1024), _single_producer, _single_consumer, _stop_each),
+    ("BlockingQueue put/get", lambda: dstlib.BlockingQueue(maxsize=1024), _single_producer, _single_consumer, _stop_each),
+    ("BlockingQueue batched", lambda: dstlib.BlockingQueue(maxsize=1024), _batch_producer, _batch_consumer, _close),
+]
+
+
+def main(n=200000, threads=8):
+    print("%-24s %12s" % ("queue", "items/s"))
+    for name, factory, producer, consumer, finish in CASES:
+        elapsed = _run(producer, consumer, finish, factory(), n, threads)
+        print("%-24s %12.0f" % (name, n / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
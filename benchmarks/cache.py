@@ -0,0 +1,88 @@
+"""
+Cache benchmark
+
+Replays a skewed key sequence through dstlib.LRUCache, dstlib.LFUCache, a
+collections.OrderedDict LRU and functools.lru_cache, and reports the time per
+lookup and the hit ratio.
+
+Usage: python benchmarks/cache.py [number_of_lookups] [maxsize]
+"""
+import collections
+import functools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+
+class OrderedDictLRU:
+    """Reference LRU cache built on collections.OrderedDict"""
+
+    def __init__(self, maxsize):
+        self._data = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._hits = self._misses = 0
+
+    def get(self, key, default=None):
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+            self._hits += 1
+            return data[key]
+        self._misses += 1
+        return default
+
+    def put(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def stats(self):
+        return {"hits": self._hits, "misses": self._misses}
+
+
+def _keys(n, universe=20000, seed=7):
+    """Skewed keys: a few hot keys and a long tail"""
+    rng = random.Random(seed)
+    return [int(universe * rng.random() ** 3) for _ in range(n)]
+
+
+def _replay(cache, keys):
+    get = cache.get
+    put = cache.put
+    for key in keys:
+        if get(key) is None:
+            put(key, key)
+
+
+def main(n=200000, maxsize=500):
+    keys = _keys(n)
+    print("%-22s %10s %10s" % ("cache", "ns/lookup", "hit ratio"))
+    for name, cache in [("dstlib.LRUCache", dstlib.LRUCache(maxsize)),
+                        ("dstlib.LFUCache", dstlib.LFUCache(maxsize)),
+                        ("OrderedDict LRU", OrderedDictLRU(maxsize))]:
+        start = time.perf_counter()
+        _replay(cache, keys)
+        elapsed = time.perf_counter() - start
+        stats = cache.stats()
+        print("%-22s %10.1f %10.3f" % (name, elapsed / n * 1e9, stats["hits"] / n))
+
+    for name, decorator in [("@dstlib.LRUCache", dstlib.LRUCache(maxsize)),
+                            ("@functools.lru_cache", functools.lru_cache(maxsize))]:
+        identity = decorator(lambda key: key)
+        start = time.perf_counter()
+        for key in keys:
+            identity(key)
+        elapsed = time.perf_counter() - start
+        info = identity.cache.stats() if hasattr(identity, "cache") else identity.cache_info()._asdict()
+        print("%-22s %10.1f %10.3f" % (name, elapsed / n * 1e9, info["hits"] / n))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,123 @@
+"""
+Memory footprint benchmark
+
+Reports the number of bytes allocated per element by every dstlib structure,
+next to the built-in list and collections.deque, using tracemalloc. The NumPy
+backed TypedStack and TypedQueue are included when NumPy is installed.
+
+Usage: python benchmarks/memory.py [number_of_elements]
+"""
+import collections
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+
+def _fill_list(n):
+    container = []
+    for i in range(n):
+        container.append(i)
+    return container
+
+
+def _fill_deque(n):
+    container = collections.deque()
+    for i in range(n):
+        container.append(i)
+    return container
+
+
+def _fill_linked_list(n):
+    container = dstlib.LinkedList()
+    for i in range(n):
+        container.append(i)
+    return container
+
+
+def _fill_queue(n):
+    container = dstlib.Queue()
+    for i in range(n):
+        container.enqueue(i)
+    return container
+
+
+def _fill_stack(n):
+    container = dstlib.Stack()
+    for i in range(n):
+        container.push(i)
+    return container
+
+
+def _fill_typed_stack(n):
+    container = dstlib.TypedStack(int)
+    for i in range(n):
+        container.push(i)
+    return container
+
+
+def _fill_typed_queue(n):
+    container = dstlib.TypedQueue(int)
+    for i in range(n):
+        container.enqueue(i)
+    return container
+
+
+def _positions(n):
+    L = dstlib.LinkedList()
+    for i in range(n):
+        L.append(i)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    positions = [L.first_position() for _ in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # discount the list holding the positions
+    return (after - before - sys.getsizeof(positions)) / n
+
+
+BUILDERS = [
+    ("list", _fill_list),
+    ("collections.deque", _fill_deque),
+    ("dstlib.LinkedList", _fill_linked_list),
+    ("dstlib.Queue", _fill_queue),
+    ("dstlib.Stack", _fill_stack),
+]
+
+if dstlib.typed.np is not None:
+    BUILDERS += [
+        ("dstlib.TypedStack", _fill_typed_stack),
+        ("dstlib.TypedQueue", _fill_typed_queue),
+    ]
+
+
+def bytes_per_element(builder, n):
+    """
+    Measure the memory retained by a structure holding n small integers
+
+    Param builder: function building the structure from range(n)
+    Param n: number of elements
+
+    Returns: float: bytes allocated per element
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = builder(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del container
+    return (after - before) / n
+
+
+def main(n=100000):
+    print("%-20s %12s" % ("structure", "bytes/elem"))
+    for name, builder in BUILDERS:
+        print("%-20s %12.1f" % (name, bytes_per_element(builder, n)))
+    print("%-20s %12.1f" % ("LinkedList.Position", _positions(n)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,92 @@
+"""
+Node churn benchmark
+
+Runs a steady enqueue/dequeue (and push/pop, append/delete) workload with and
+without a shared dstlib.NodePool, and reports the time per operation, the
+number of nodes allocated per operation and the number of garbage collector
+runs.
+
+Usage: python benchmarks/node_churn.py [number_of_operations]
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+DEPTH = 1000
+
+
+def _queue_churn(pool, n):
+    Q = dstlib.Queue(pool=pool)
+    for i in range(DEPTH):
+        Q.enqueue(i)
+    for i in range(n):
+        Q.enqueue(i)
+        Q.dequeue()
+
+
+def _stack_churn(pool, n):
+    S = dstlib.Stack(pool=pool)
+    for i in range(DEPTH):
+        S.push(i)
+    for i in range(n):
+        S.push(i)
+        S.pop()
+
+
+def _linked_list_churn(pool, n):
+    L = dstlib.LinkedList(pool=pool)
+    for i in range(DEPTH):
+        L.append(i)
+    for i in range(n):
+        L.append(i)
+        L.delete(L.first_position())
+
+
+WORKLOADS = [
+    ("Queue", _queue_churn),
+    ("Stack", _stack_churn),
+    ("LinkedList", _linked_list_churn),
+]
+
+
+def measure(workload, pool, n):
+    """
+    Run a churn workload and measure it
+
+    Returns: tuple (ns per operation, nodes allocated per operation, gc runs)
+    """
+    collections = [0]
+
+    def count(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    gc.collect()
+    gc.callbacks.append(count)
+    start = time.perf_counter()
+    workload(pool, n)
+    elapsed = time.perf_counter() - start
+    gc.callbacks.remove(count)
+    ops = 2 * (n + DEPTH)
+    if pool is None:
+        allocations = n + DEPTH
+    else:
+        allocations = pool.misses
+    return elapsed / ops * 1e9, allocations / ops, collections[0]
+
+
+def main(n=500000):
+    print("%-12s %-8s %10s %14s %8s" % ("structure", "pool", "ns/op", "allocs/op", "gc runs"))
+    for name, workload in WORKLOADS:
+        for pool in (None, dstlib.NodePool()):
+            ns, allocs, runs = measure(workload, pool, n)
+            print("%-12s %-8s %10.1f %14.4f %8d" % (name, "yes" if pool else "no", ns, allocs, runs))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
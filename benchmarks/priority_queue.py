@@ -0,0 +1,81 @@
+"""
+Priority queue benchmark
+
+Runs Dijkstra's shortest paths on a random directed graph with
+dstlib.PriorityQueue (one entry per vertex, decrease_key on relaxation) and
+with heapq using lazy deletion (a new entry per relaxation, stale entries
+skipped when popped), and reports the time and the peak number of queued
+entries.
+
+Usage: python benchmarks/priority_queue.py [number_of_vertices] [edges_per_vertex]
+"""
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+
+def _graph(n, degree, seed=3):
+    rng = random.Random(seed)
+    return [[(rng.randrange(n), rng.randrange(1, 1000)) for _ in range(degree)] for _ in range(n)]
+
+
+def dijkstra_dstlib(graph, source):
+    dist = {source: 0}
+    PQ = dstlib.PriorityQueue()
+    positions = {source: PQ.push(source, 0)}
+    peak = 1
+    while PQ:
+        d, u = PQ.pop()
+        del positions[u]
+        for v, w in graph[u]:
+            nd = d + w
+            if v not in dist:
+                dist[v] = nd
+                positions[v] = PQ.push(v, nd)
+                peak = max(peak, len(PQ))
+            elif nd < dist[v] and v in positions:
+                dist[v] = nd
+                PQ.decrease_key(positions[v], nd)
+    return dist, peak
+
+
+def dijkstra_heapq(graph, source):
+    dist = {source: 0}
+    done = set()
+    heap = [(0, source)]
+    peak = 1
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        for v, w in graph[u]:
+            nd = d + w
+            if nd < dist.get(v, nd + 1):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+                peak = max(peak, len(heap))
+    return dist, peak
+
+
+def main(n=100000, degree=8):
+    graph = _graph(n, degree)
+    print("%-28s %10s %12s" % ("priority queue", "seconds", "peak entries"))
+    results = []
+    for name, run in [("dstlib.PriorityQueue", dijkstra_dstlib), ("heapq + lazy deletion", dijkstra_heapq)]:
+        start = time.perf_counter()
+        dist, peak = run(graph, 0)
+        elapsed = time.perf_counter() - start
+        results.append(dist)
+        print("%-28s %10.3f %12d" % (name, elapsed, peak))
+    assert results[0] == results[1]
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,63 @@
+"""
+Queue throughput benchmark
+
+Times a fill-then-drain cycle and a steady-state enqueue/dequeue cycle on the
+linked dstlib.Queue, the ring buffer dstlib.ArrayQueue and collections.deque.
+
+Usage: python benchmarks/queue_throughput.py [number_of_elements]
+"""
+import collections
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+
+class _Deque(collections.deque):
+    enqueue = collections.deque.append
+    dequeue = collections.deque.popleft
+
+
+QUEUES = [
+    ("dstlib.Queue", dstlib.Queue),
+    ("dstlib.ArrayQueue", dstlib.ArrayQueue),
+    ("collections.deque", _Deque),
+]
+
+
+def fill_drain(factory, n):
+    """Enqueue n elements then dequeue all of them"""
+    Q = factory()
+    enqueue = Q.enqueue
+    dequeue = Q.dequeue
+    for i in range(n):
+        enqueue(i)
+    for _ in range(n):
+        dequeue()
+
+
+def steady_state(factory, n, depth=64):
+    """Keep about depth elements queued while n elements go through the queue"""
+    Q = factory()
+    enqueue = Q.enqueue
+    dequeue = Q.dequeue
+    for i in range(depth):
+        enqueue(i)
+    for i in range(n):
+        enqueue(i)
+        dequeue()
+
+
+def main(n=200000):
+    print("%-20s %16s %16s" % ("queue", "fill+drain ns/op", "steady ns/op"))
+    for name, factory in QUEUES:
+        fill = min(timeit.repeat(lambda: fill_drain(factory, n), number=1, repeat=3))
+        steady = min(timeit.repeat(lambda: steady_state(factory, n), number=1, repeat=3))
+        print("%-20s %16.1f %16.1f" % (name, fill / (2 * n) * 1e9, steady / (2 * n) * 1e9))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,67 @@
+"""
+Shared queue benchmark
+
+One producer process sends fixed-size byte records to a number of consumer
+processes through dstlib.SharedQueue and through multiprocessing.Queue, and
+reports the records per second.
+
+Usage: python benchmarks/shared_queue.py [number_of_records] [consumers] [record_size]
+"""
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dstlib
+
+STOP = b''
+
+
+def _consume_shared(Q, done):
+    count = 0
+    while Q.get() != STOP:
+        count += 1
+    done.put(count)
+    Q.close()
+
+
+def _consume_mp(Q, done):
+    count = 0
+    while Q.get() != STOP:
+        count += 1
+    done.put(count)
+
+
+def _run(Q, consume, n, consumers, record):
+    done = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=consume, args=(Q, done)) for _ in range(consumers)]
+    for process in processes:
+        process.start()
+    start = time.perf_counter()
+    for _ in range(n):
+        Q.put(record)
+    for _ in range(consumers):
+        Q.put(STOP)
+    received = sum(done.get() for _ in range(consumers))
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    assert received == n
+    return elapsed
+
+
+def main(n=200000, consumers=2, record_size=64):
+    record = b'x' * record_size
+    print("%d records of %d bytes, %d consumers, %d cores" % (n, record_size, consumers, os.cpu_count() or 1))
+    print("%-26s %12s" % ("queue", "records/s"))
+    with dstlib.SharedQueue(slots=4096, slot_size=record_size + 4) as Q:
+        elapsed = _run(Q, _consume_shared, n, consumers, record)
+    print("%-26s %12.0f" % ("dstlib.SharedQueue", n / elapsed))
+    elapsed = _run(multiprocessing.Queue(4096), _consume_mp, n, consumers, record)
+    print("%-26s %12.0f" % ("multiprocessing.Queue", n / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -1,3 +1,15 @@
+from .node import NodePool
 from .linked_list import LinkedList
 from .stack import Stack
 from .queue import Queue
+from .priority_queue import PriorityQueue
+from .aggregate import AggregateStack, AggregateQueue
+from .array_queue import ArrayQueue
+from .blocking_queue import BlockingQueue
+from .shared_queue import SharedQueue
+from .persistent_queue import PersistentQueue
+from .typed import TypedStack, TypedQueue
+from .async_structures import AsyncQueue, AsyncStack
+from .cache import LRUCache, LFUCache
+from .instrumentation import Instrumentation, instrument, uninstrument, instrument_all, uninstrument_all
+from .exceptions import DstlibError, Empty, Full, Closed
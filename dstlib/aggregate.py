@@ -0,0 +1,319 @@
+from .node import Node
+from .stack import StackBase
+from .exceptions import Empty
+
+
+class _AggregateNode(Node):
+    """Stack node that also stores the min, the max and the reduction of the elements from itself to the bottom"""
+    __slots__ = '_min', '_max', '_reduced'
+
+
+class AggregateStack(StackBase):
+    """
+    Stack that keeps the running min, max and reduction alongside each node
+
+    Every node stores the aggregates of the elements from itself down to the bottom
+    of the stack, so min(), max() and reduce() are O(1) and popping restores the
+    aggregates of the remaining elements for free. The elements must be comparable.
+    """
+
+    def __init__(self, op=None):
+        """
+        Initiate an empty aggregate stack
+
+        Param op: optional associative two-argument function reduced over the elements, e.g. operator.add: default to None
+        """
+        super().__init__()
+        self._op = op
+        self._top_first = False
+
+    def _link(self, node):
+        """Utility method: push a node on top of the stack, computing its aggregates from the node below"""
+        el = node._element
+        below = self._head
+        node._next = below
+        if below is None:
+            node._min = node._max = node._reduced = el
+        else:
+            node._min = el if el < below._min else below._min
+            node._max = el if below._max < el else below._max
+            op = self._op
+            if op is not None:
+                if self._top_first:
+                    node._reduced = op(el, below._reduced)
+                else:
+                    node._reduced = op(below._reduced, el)
+        self._head = node
+        self._size += 1
+
+    def push(self, el, called=False):
+        """
+        Add a giving element to the top of the stack, in O(1)
+
+        Param el: element to be added to the stack
+        Param called: a flag to seperate between user call and the system call: default to False
+
+        Returns: None (nothing) if called is False but return the newly added node if called is set to True
+        """
+        node = _AggregateNode(el, None)
+        self._link(node)
+        if called:
+            return node
+
+    def push_many(self, iterable):
+        """
+        Push all the elements of a giving iterable, the last one ending at the top of the stack
+
+        Param iterable: elements to be added to the stack
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        for el in iterable:
+            self._link(_AggregateNode(el, None))
+
+    def _top_node(self):
+        """Utility method: the top node, raising Empty if the stack is empty"""
+        if self._head is None:
+            raise Empty("Stack is empty")
+        return self._head
+
+    def min(self):
+        """
+        Returns the smallest element in the stack, in O(1)
+
+        Returns: the smallest element
+        """
+        return self._top_node()._min
+
+    def max(self):
+        """
+        Returns the largest element in the stack, in O(1)
+
+        Returns: the largest element
+        """
+        return self._top_node()._max
+
+    def reduce(self):
+        """
+        Returns op reduced over the elements from the bottom to the top of the stack, in O(1)
+
+        Returns: the reduction; raises TypeError if the stack was created without op
+        """
+        if self._op is None:
+            raise TypeError("reduce() needs a stack created with an op")
+        return self._top_node()._reduced
+
+
+class AggregateQueue:
+    """
+    Queue with amortized O(1) min, max and reduction, using two aggregate stacks
+
+    Elements are enqueued on a back stack and dequeued from a front stack; when the
+    front stack runs out, the nodes of the back stack are relinked onto it in reverse
+    order, recomputing their aggregates. This makes sliding window aggregation O(1)
+    per event. The elements must be comparable.
+    """
+
+    def __init__(self, op=None):
+        """
+        Initiate an empty aggregate queue
+
+        Param op: optional associative two-argument function reduced over the elements, e.g. operator.add: default to None
+        """
+        self._op = op
+        self._back = AggregateStack(op)
+        self._front = AggregateStack(op)
+        self._front._top_first = True
+        self._last = None
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue
+
+        Returns: int: size of the queue
+        """
+        return len(self._front) + len(self._back)
+
+    def is_empty(self):
+        """
+        Return True if queue is empty
+
+        Returns: bool
+        """
+        return self._front._head is None and self._back._head is None
+
+    def _refill(self):
+        """Utility method: move the nodes of the back stack onto the empty front stack, oldest element ending at the top"""
+        front = self._front
+        back = self._back
+        node = back._head
+        back._head = None
+        back._size = 0
+        while node is not None:
+            next_node = node._next
+            front._link(node)
+            node = next_node
+
+    def enqueue(self, el):
+        """
+        Add a giving element to the end of the queue, in O(1)
+
+        Param el: element to be added to the queue
+
+        Returns: None (nothing)
+        """
+        self._back.push(el)
+        self._last = el
+
+    def dequeue(self):
+        """
+        Remove an element from the front of the queue, in amortized O(1)
+
+        Returns: the removed element
+        """
+        front = self._front
+        if front._head is None:
+            if self._back._head is None:
+                raise Empty("Queue is empty")
+            self._refill()
+        el = StackBase.pop(front)
+        if self.is_empty():
+            self._last = None
+        return el
+
+    def enqueue_many(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the queue
+
+        Param iterable: elements to be added to the queue
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        back = self._back
+        for el in iterable:
+            back._link(_AggregateNode(el, None))
+            self._last = el
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        count = min(n, len(self))
+        return [self.dequeue() for _ in range(count)]
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a queue holding the elements of a giving iterable, first element at the front
+
+        Param iterable: elements of the new queue
+        Param kwargs: keyword arguments of the constructor (op)
+
+        Returns: the new queue
+        """
+        Q = cls(**kwargs)
+        Q.enqueue_many(iterable)
+        return Q
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        if self.is_empty():
+            return default
+        return self.dequeue()
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        if self.is_empty():
+            return False, None
+        return True, self.dequeue()
+
+    def first(self):
+        """Returns the first element in the queue"""
+        if self._front._head is None:
+            if self._back._head is None:
+                raise Empty("Queue is empty")
+            self._refill()
+        return self._front._head._element
+
+    def last(self):
+        """Returns the last element in the queue"""
+        if self.is_empty():
+            raise Empty("Queue is empty")
+        return self._last
+
+    def min(self):
+        """
+        Returns the smallest element in the queue, in O(1)
+
+        Returns: the smallest element
+        """
+        front = self._front._head
+        back = self._back._head
+        if front is None:
+            if back is None:
+                raise Empty("Queue is empty")
+            return back._min
+        if back is None or front._min <= back._min:
+            return front._min
+        return back._min
+
+    def max(self):
+        """
+        Returns the largest element in the queue, in O(1)
+
+        Returns: the largest element
+        """
+        front = self._front._head
+        back = self._back._head
+        if front is None:
+            if back is None:
+                raise Empty("Queue is empty")
+            return back._max
+        if back is None or back._max <= front._max:
+            return front._max
+        return back._max
+
+    def reduce(self):
+        """
+        Returns op reduced over the elements from the front to the end of the queue, in O(1)
+
+        Returns: the reduction; raises TypeError if the queue was created without op
+        """
+        if self._op is None:
+            raise TypeError("reduce() needs a queue created with an op")
+        front = self._front._head
+        back = self._back._head
+        if front is None:
+            if back is None:
+                raise Empty("Queue is empty")
+            return back._reduced
+        if back is None:
+            return front._reduced
+        return self._op(front._reduced, back._reduced)
+
+    def __iter__(self):
+        """
+        Special method (iterator) to allow iterating over the queue from the front
+
+        Returns: None (nothing)
+        """
+        yield from list(self._front)
+        yield from reversed(list(self._back))
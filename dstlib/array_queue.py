@@ -0,0 +1,215 @@
+from .exceptions import Empty
+
+
+class ArrayQueue:
+    """Queue implementation using a circular array (ring buffer) that grows and shrinks geometrically"""
+
+    DEFAULT_CAPACITY = 8
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Initiate an empty queue
+
+        Param capacity: initial number of slots of the underlying array: default to 8
+        """
+        self._data = [None] * max(capacity, 1)
+        self._front = 0
+        self._size = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue
+
+        Returns: int: size of the queue
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if queue is empty
+
+        Returns: bool
+        """
+        return self._size == 0
+
+    def _resize(self, capacity):
+        """Utility method: move the elements into a new array of the giving capacity, front at index 0"""
+        old = self._data
+        front = self._front
+        end = front + self._size
+        if end <= len(old):
+            data = old[front:end]
+        else:
+            data = old[front:] + old[:end - len(old)]
+        data.extend([None] * (capacity - self._size))
+        self._data = data
+        self._front = 0
+
+    def enqueue(self, el):
+        """
+        Add a giving element to the end of the queue, doubling the array when it is full
+
+        Param el: element to be added to the queue
+
+        Returns: None (nothing)
+        """
+        data = self._data
+        if self._size == len(data):
+            self._resize(2 * len(data))
+            data = self._data
+        data[(self._front + self._size) % len(data)] = el
+        self._size += 1
+
+    def dequeue(self):
+        """
+        Remove an element from the front of the queue, halving the array when it is less than a quarter full
+
+        Returns: the removed element
+        """
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        data = self._data
+        front = self._front
+        el = data[front]
+        data[front] = None
+        self._front = (front + 1) % len(data)
+        self._size -= 1
+        capacity = len(data)
+        if capacity > self.DEFAULT_CAPACITY and self._size < capacity // 4:
+            self._resize(capacity // 2)
+        return el
+
+    def enqueue_many(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the queue, growing the array at most once
+
+        Param iterable: elements to be added to the queue
+
+        Returns: None (nothing)
+        """
+        items = list(iterable)
+        needed = self._size + len(items)
+        capacity = len(self._data)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        data = self._data
+        capacity = len(data)
+        back = (self._front + self._size) % capacity
+        first_part = min(len(items), capacity - back)
+        data[back:back + first_part] = items[:first_part]
+        data[:len(items) - first_part] = items[first_part:]
+        self._size = needed
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue, shrinking the array at most once
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        count = min(n, self._size)
+        if count <= 0:
+            return []
+        data = self._data
+        capacity = len(data)
+        front = self._front
+        end = front + count
+        if end <= capacity:
+            items = data[front:end]
+            data[front:end] = [None] * count
+        else:
+            items = data[front:] + data[:end - capacity]
+            data[front:] = [None] * (capacity - front)
+            data[:end - capacity] = [None] * (end - capacity)
+        self._front = end % capacity
+        self._size -= count
+        while capacity > self.DEFAULT_CAPACITY and self._size < capacity // 4:
+            capacity //= 2
+        if capacity != len(data):
+            self._resize(capacity)
+        return items
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a queue holding the elements of a giving iterable, first element at the front
+
+        Param iterable: elements of the new queue
+        Param kwargs: keyword arguments of the constructor
+
+        Returns: the new queue
+        """
+        Q = cls(**kwargs)
+        Q.enqueue_many(iterable)
+        return Q
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        if self._size == 0:
+            return default
+        return self.dequeue()
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        if self._size == 0:
+            return False, None
+        return True, self.dequeue()
+
+    def first(self):
+        """Returns the first element in the queue"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return self._data[self._front]
+
+    def last(self):
+        """Returns the last element in the queue"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return self._data[(self._front + self._size - 1) % len(self._data)]
+
+    def rotate(self):
+        """Takes the first element to the end of the queue"""
+        if self._size == 0:
+            raise Empty("Queue is empty! You cannot rotate an empty queue")
+        data = self._data
+        capacity = len(data)
+        front = self._front
+        el = data[front]
+        data[front] = None
+        self._front = (front + 1) % capacity
+        data[(self._front + self._size - 1) % capacity] = el
+
+    def concat(self, Q):
+        """
+        Join a giving queue to the current queue from the end of the current queue
+        Param Q: A queue object to be joined with the current queue
+
+        Returns: None
+        """
+        for el in list(Q):
+            self.enqueue(el)
+
+    def __iter__(self):
+        """
+        Special method (iterator) to allow iterating over the queue
+
+        Returns: None (nothing)
+        """
+        data = self._data
+        capacity = len(data)
+        front = self._front
+        for k in range(self._size):
+            yield data[(front + k) % capacity]
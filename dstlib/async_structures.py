@@ -0,0 +1,379 @@
+import asyncio
+import collections
+
+from .queue import QueueBase
+from .stack import StackBase
+from .exceptions import Empty, Full
+
+
+def _wakeup_next(waiters):
+    """Utility function: wake up the first waiter that is still waiting"""
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+async def _wait(waiters, wake_on_cancel, timeout=None):
+    """
+    Utility function: suspend the current task until woken up through waiters
+
+    Param waiters: deque of futures the task registers its own future in
+    Param wake_on_cancel: function returning True if a wake-up received just before a cancellation must be passed on
+    Param timeout: maximum number of seconds to wait, None waits until woken up: default to None
+
+    Returns: bool: False if the timeout expired first
+    """
+    waiter = asyncio.get_running_loop().create_future()
+    waiters.append(waiter)
+    try:
+        if timeout is None:
+            await waiter
+        else:
+            await asyncio.wait_for(waiter, timeout)
+        return True
+    except asyncio.TimeoutError:
+        _discard(waiters, waiter)
+        return False
+    except BaseException:
+        waiter.cancel()
+        _discard(waiters, waiter)
+        if not waiter.cancelled() and wake_on_cancel():
+            _wakeup_next(waiters)
+        raise
+
+
+def _discard(waiters, waiter):
+    """Utility function: remove a waiter that gave up from the waiters, if it is still there"""
+    try:
+        waiters.remove(waiter)
+    except ValueError:
+        pass
+
+
+class AsyncQueue(QueueBase):
+    """asyncio queue with awaitable put/get and optional bounded capacity, using a queue base class"""
+
+    def __init__(self, maxsize=0):
+        """
+        Initiate an empty asyncio queue
+
+        Param maxsize: maximum number of queued elements, put waits while the queue is full; 0 means unbounded: default to 0
+        """
+        super().__init__()
+        self._maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def is_full(self):
+        """
+        Return True if the queue holds maxsize elements
+
+        Returns: bool
+        """
+        return 0 < self._maxsize <= self._size
+
+    def _has_items(self):
+        """Utility method: True if an element can be taken"""
+        return self._size > 0
+
+    def _has_space(self):
+        """Utility method: True if an element can be added"""
+        return not self.is_full()
+
+    async def put(self, el):
+        """
+        Add a giving element to the end of the queue, waiting for a free slot if the queue is full
+
+        Param el: element to be added to the queue
+
+        Returns: None (nothing)
+        """
+        while 0 < self._maxsize <= self._size:
+            await _wait(self._putters, self._has_space)
+        QueueBase.enqueue(self, el)
+        if self._getters:
+            _wakeup_next(self._getters)
+
+    async def get(self):
+        """
+        Remove an element from the front of the queue, waiting for one if the queue is empty
+
+        Returns: the removed element
+        """
+        while self._size == 0:
+            await _wait(self._getters, self._has_items)
+        el = QueueBase.dequeue(self)
+        if self._putters:
+            _wakeup_next(self._putters)
+        return el
+
+    async def get_batch(self, max_items, timeout=None):
+        """
+        Remove up to max_items elements from the front of the queue for micro-batching
+
+        Without a timeout, waits for the first element and returns whatever is available then.
+        With a timeout, keeps collecting until max_items elements are gathered or the timeout expires.
+
+        Param max_items: maximum number of elements to remove
+        Param timeout: number of seconds to collect elements for, None returns as soon as one is available: default to None
+
+        Returns: list of the removed elements, possibly empty when a timeout is given
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        items = []
+        while True:
+            while self._size > 0 and len(items) < max_items:
+                items.append(QueueBase.dequeue(self))
+                if self._putters:
+                    _wakeup_next(self._putters)
+            if len(items) >= max_items or (deadline is None and items):
+                break
+            if deadline is None:
+                await _wait(self._getters, self._has_items)
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0 or not await _wait(self._getters, self._has_items, remaining):
+                    break
+        if self._size > 0:
+            _wakeup_next(self._getters)
+        return items
+
+    def enqueue(self, el):
+        """
+        Add a giving element to the end of the queue without waiting, waking up a waiting get
+
+        Param el: element to be added to the queue
+
+        Returns: None (nothing); raises Full if the queue is full
+        """
+        if 0 < self._maxsize <= self._size:
+            raise Full("Queue is full")
+        QueueBase.enqueue(self, el)
+        if self._getters:
+            _wakeup_next(self._getters)
+
+    def dequeue(self):
+        """
+        Remove an element from the front of the queue without waiting, waking up a waiting put
+
+        Returns: the removed element; raises Empty if the queue is empty
+        """
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        el = QueueBase.dequeue(self)
+        if self._putters:
+            _wakeup_next(self._putters)
+        return el
+
+    def concat(self, Q):
+        """
+        Add all the elements of a giving queue to the end of the queue without waiting, keeping Q unchanged
+
+        Param Q: A queue object whose elements are added to the queue
+
+        Returns: None (nothing); raises Full, adding nothing, if there are not enough free slots
+        """
+        self.enqueue_many(list(Q))
+
+    def concat_detroy(self, Q):
+        """
+        Join a giving queue to the end of the queue in O(1) without waiting and destroy the giving queue
+
+        Waiting gets of the queue are woken up and, when Q is an AsyncQueue, so are the waiting puts of Q.
+
+        Param Q: A queue object to join with the current queue
+
+        Returns: None (nothing); raises Full, leaving both queues unchanged, if there are not enough free slots
+        """
+        count = len(Q)
+        if Q is not self and self._maxsize > 0 and self._size + count > self._maxsize:
+            raise Full("Queue is full")
+        QueueBase.concat_detroy(self, Q)
+        for _ in range(min(count, len(self._getters))):
+            _wakeup_next(self._getters)
+        if isinstance(Q, AsyncQueue):
+            for _ in range(min(count, len(Q._putters))):
+                _wakeup_next(Q._putters)
+
+    def enqueue_many(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the queue without waiting
+
+        Param iterable: elements to be added to the queue
+
+        Returns: None (nothing); raises Full, adding nothing, if there are not enough free slots
+        """
+        items = list(iterable)
+        if self._maxsize > 0 and self._size + len(items) > self._maxsize:
+            raise Full("Queue is full")
+        QueueBase.enqueue_many(self, items)
+        for _ in range(min(len(items), len(self._getters))):
+            _wakeup_next(self._getters)
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue without waiting
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        items = QueueBase.dequeue_many(self, n)
+        for _ in range(min(len(items), len(self._putters))):
+            _wakeup_next(self._putters)
+        return items
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without waiting or raising
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        if self._size == 0:
+            return default
+        el = QueueBase.dequeue(self)
+        if self._putters:
+            _wakeup_next(self._putters)
+        return el
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without waiting or raising
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        if self._size == 0:
+            return False, None
+        return True, self.dequeue_or()
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over a snapshot of the queue
+
+        Returns: None (nothing)
+        """
+        return iter(list(QueueBase.__iter__(self)))
+
+
+class AsyncStack(StackBase):
+    """asyncio stack with awaitable push/pop and optional bounded capacity, using a stack base class"""
+
+    def __init__(self, maxsize=0):
+        """
+        Initiate an empty asyncio stack
+
+        Param maxsize: maximum number of elements, push waits while the stack is full; 0 means unbounded: default to 0
+        """
+        super().__init__()
+        self._maxsize = maxsize
+        self._poppers = collections.deque()
+        self._pushers = collections.deque()
+
+    def is_full(self):
+        """
+        Return True if the stack holds maxsize elements
+
+        Returns: bool
+        """
+        return 0 < self._maxsize <= self._size
+
+    def _has_items(self):
+        """Utility method: True if an element can be taken"""
+        return self._size > 0
+
+    def _has_space(self):
+        """Utility method: True if an element can be added"""
+        return not self.is_full()
+
+    async def push(self, el):
+        """
+        Add a giving element to the top of the stack, waiting for a free slot if the stack is full
+
+        Param el: element to be added to the stack
+
+        Returns: None (nothing)
+        """
+        while 0 < self._maxsize <= self._size:
+            await _wait(self._pushers, self._has_space)
+        StackBase.push(self, el)
+        if self._poppers:
+            _wakeup_next(self._poppers)
+
+    async def pop(self):
+        """
+        Remove the element at the top of the stack, waiting for one if the stack is empty
+
+        Returns: the removed element
+        """
+        while self._size == 0:
+            await _wait(self._poppers, self._has_items)
+        el = StackBase.pop(self)
+        if self._pushers:
+            _wakeup_next(self._pushers)
+        return el
+
+    def push_many(self, iterable):
+        """
+        Push all the elements of a giving iterable without waiting, the last one ending at the top
+
+        Param iterable: elements to be added to the stack
+
+        Returns: None (nothing); raises Full, adding nothing, if there are not enough free slots
+        """
+        items = list(iterable)
+        if self._maxsize > 0 and self._size + len(items) > self._maxsize:
+            raise Full("Stack is full")
+        StackBase.push_many(self, items)
+        for _ in range(min(len(items), len(self._poppers))):
+            _wakeup_next(self._poppers)
+
+    def pop_many(self, n):
+        """
+        Remove up to n elements from the top of the stack without waiting
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, top element first
+        """
+        items = StackBase.pop_many(self, n)
+        for _ in range(min(len(items), len(self._pushers))):
+            _wakeup_next(self._pushers)
+        return items
+
+    def pop_or(self, default=None):
+        """
+        Remove the element at the top of the stack without waiting or raising
+
+        Param default: value returned when the stack is empty: default to None
+
+        Returns: the removed element, or default if the stack is empty
+        """
+        if self._size == 0:
+            return default
+        el = StackBase.pop(self)
+        if self._pushers:
+            _wakeup_next(self._pushers)
+        return el
+
+    def try_pop(self):
+        """
+        Remove the element at the top of the stack without waiting or raising
+
+        Returns: tuple (True, removed element), or (False, None) if the stack is empty
+        """
+        if self._size == 0:
+            return False, None
+        return True, self.pop_or()
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over a snapshot of the stack, from the top
+
+        Returns: None (nothing)
+        """
+        return iter(list(StackBase.__iter__(self)))
@@ -0,0 +1,305 @@
+import threading
+import time
+
+from .queue import QueueBase
+from .exceptions import Empty, Full, Closed
+from .exceptions import ValueError
+
+
+class BlockingQueue(QueueBase):
+    """Thread safe, optionally bounded, blocking queue using a queue base class and condition variables"""
+
+    def __init__(self, maxsize=0):
+        """
+        Initiate an empty blocking queue
+
+        Param maxsize: maximum number of queued elements, put blocks while the queue is full; 0 means unbounded: default to 0
+        """
+        super().__init__()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+    def _has_items(self):
+        """Utility method: True if an element can be taken"""
+        return self._size > 0
+
+    def _has_space(self):
+        """Utility method: True if an element can be added"""
+        return self._maxsize <= 0 or self._size < self._maxsize
+
+    def _wait(self, condition, ready, deadline):
+        """
+        Utility method: wait on condition (lock held) until ready() returns True or the queue is closed
+
+        Param condition: the condition variable to wait on
+        Param ready: function returning True once the caller can proceed
+        Param deadline: time.monotonic() value after which to give up, or None to wait forever
+
+        Returns: bool: False if the deadline expired first
+        """
+        while not ready() and not self._closed:
+            if deadline is None:
+                condition.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                condition.wait(remaining)
+        return True
+
+    @staticmethod
+    def _deadline(timeout):
+        """Utility method: convert a timeout in seconds into a deadline"""
+        if timeout is None:
+            return None
+        return time.monotonic() + timeout
+
+    def put(self, el, timeout=None):
+        """
+        Add a giving element to the end of the queue, waiting for a free slot if the queue is full
+
+        Param el: element to be added to the queue
+        Param timeout: maximum number of seconds to wait, None waits forever: default to None
+
+        Returns: None (nothing); raises Full on timeout and Closed if the queue is closed
+        """
+        with self._lock:
+            if not self._wait(self._not_full, self._has_space, self._deadline(timeout)):
+                raise Full("Queue is full")
+            if self._closed:
+                raise Closed("Queue is closed")
+            QueueBase.enqueue(self, el)
+            self._not_empty.notify()
+
+    def put_many(self, iterable, timeout=None):
+        """
+        Add all the elements of a giving iterable to the end of the queue, taking the lock once per batch
+
+        The lock is only released while waiting for free slots in a bounded queue. Elements added
+        before a timeout or a close stay in the queue.
+
+        Param iterable: elements to be added to the queue
+        Param timeout: maximum number of seconds to wait for the whole batch, None waits forever: default to None
+
+        Returns: None (nothing); raises Full on timeout and Closed if the queue is closed
+        """
+        deadline = self._deadline(timeout)
+        with self._lock:
+            if self._closed:
+                raise Closed("Queue is closed")
+            added = 0
+            try:
+                for el in iterable:
+                    if not self._has_space():
+                        if added:
+                            self._not_empty.notify(added)
+                            added = 0
+                        if not self._wait(self._not_full, self._has_space, deadline):
+                            raise Full("Queue is full")
+                        if self._closed:
+                            raise Closed("Queue is closed")
+                    QueueBase.enqueue(self, el)
+                    added += 1
+            finally:
+                if added:
+                    self._not_empty.notify(added)
+
+    def get(self, timeout=None):
+        """
+        Remove an element from the front of the queue, waiting for one if the queue is empty
+
+        Param timeout: maximum number of seconds to wait, None waits forever: default to None
+
+        Returns: the removed element; raises Empty on timeout and Closed once a closed queue is drained
+        """
+        with self._lock:
+            if not self._wait(self._not_empty, self._has_items, self._deadline(timeout)):
+                raise Empty("Queue is empty")
+            if self._size == 0:
+                raise Closed("Queue is closed")
+            el = QueueBase.dequeue(self)
+            self._not_full.notify()
+            return el
+
+    def get_many(self, n, timeout=None):
+        """
+        Remove up to n elements from the front of the queue, taking the lock once per batch
+
+        Waits until at least one element is available, then returns without waiting for more.
+
+        Param n: maximum number of elements to remove
+        Param timeout: maximum number of seconds to wait for the first element, None waits forever: default to None
+
+        Returns: list of the removed elements, empty on timeout; raises Closed once a closed queue is drained
+        """
+        with self._lock:
+            if not self._wait(self._not_empty, self._has_items, self._deadline(timeout)):
+                return []
+            if self._size == 0:
+                raise Closed("Queue is closed")
+            count = min(n, self._size)
+            items = [QueueBase.dequeue(self) for _ in range(count)]
+            self._not_full.notify(count)
+            return items
+
+    def enqueue(self, el, called=False):
+        """Same as put(el) without a timeout"""
+        self.put(el)
+
+    def dequeue(self):
+        """Same as get() without a timeout"""
+        return self.get()
+
+    def enqueue_many(self, iterable):
+        """Same as put_many(iterable) without a timeout"""
+        self.put_many(iterable)
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue without waiting
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        with self._lock:
+            items = QueueBase.dequeue_many(self, n)
+            if items:
+                self._not_full.notify(len(items))
+            return items
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without waiting or raising
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        with self._lock:
+            if self._size == 0:
+                return default
+            el = QueueBase.dequeue(self)
+            self._not_full.notify()
+            return el
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without waiting or raising
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        with self._lock:
+            if self._size == 0:
+                return False, None
+            el = QueueBase.dequeue(self)
+            self._not_full.notify()
+            return True, el
+
+    def rotate(self):
+        """Takes the first element to the end of the queue"""
+        with self._lock:
+            QueueBase.rotate(self)
+
+    def concat(self, Q):
+        """
+        Add all the elements of a giving queue to the end of the queue, keeping Q unchanged
+
+        Same as put_many(Q) without a timeout: waits for free slots while the queue is full.
+
+        Param Q: A queue object whose elements are added to the queue
+
+        Returns: None (nothing); raises Closed if the queue is closed
+        """
+        self.put_many(list(Q))
+
+    def concat_detroy(self, Q):
+        """
+        Join a giving queue to the end of the queue and destroy the giving queue
+
+        The nodes are relinked in O(1) when the queue has room for all of them; otherwise the
+        elements are moved with put_many, waiting for free slots. When Q is a BlockingQueue, both
+        locks are held while relinking, taken in a fixed order, and the producers waiting on Q are
+        woken up.
+
+        Param Q: A queue object to join with the current queue
+
+        Returns: None (nothing); raises Closed if the queue is closed
+        """
+        if Q is self:
+            raise ValueError("cannot join a queue with itself")
+        locks = [self._lock]
+        if isinstance(Q, BlockingQueue):
+            locks.append(Q._lock)
+            locks.sort(key=id)
+        for lock in locks:
+            lock.acquire()
+        try:
+            if self._closed:
+                raise Closed("Queue is closed")
+            count = len(Q)
+            relinked = self._maxsize <= 0 or self._size + count <= self._maxsize
+            if relinked and count:
+                QueueBase.concat_detroy(self, Q)
+                self._not_empty.notify(count)
+                if len(locks) == 2:
+                    Q._not_full.notify_all()
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        if not relinked:
+            self.put_many(Q.dequeue_many(len(Q)))
+
+    def first(self):
+        """Returns the first element in the queue"""
+        with self._lock:
+            return QueueBase.first(self)
+
+    def last(self):
+        """Returns the last element in the queue"""
+        with self._lock:
+            return QueueBase.last(self)
+
+    def close(self):
+        """
+        Close the queue: further puts raise Closed, waiting producers are woken up with Closed and
+        consumers keep getting the remaining elements until the queue is drained
+
+        Returns: None (nothing)
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def is_closed(self):
+        """
+        Return True if the queue was closed
+
+        Returns: bool
+        """
+        return self._closed
+
+    def drain(self):
+        """
+        Remove all the elements currently in the queue without waiting
+
+        Returns: list of the removed elements, in queue order
+        """
+        with self._lock:
+            items = [QueueBase.dequeue(self) for _ in range(self._size)]
+            self._not_full.notify_all()
+            return items
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over a snapshot of the queue
+
+        Returns: None (nothing)
+        """
+        with self._lock:
+            items = list(QueueBase.__iter__(self))
+        return iter(items)
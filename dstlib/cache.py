@@ -0,0 +1,303 @@
+import functools
+
+from .linked_list import LinkedList
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+class _CacheBase:
+    """A base class providing statistics, eviction callbacks and the memoizing decorator of the caches"""
+
+    def __init__(self, maxsize=128, on_evict=None):
+        """
+        Initiate an empty cache
+
+        Param maxsize: maximum number of entries, must be at least 1: default to 128
+        Param on_evict: optional function called with (key, value) of every evicted entry: default to None
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._on_evict = on_evict
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """
+        Return the number of entries in the cache
+
+        Returns: int
+        """
+        return len(self._map)
+
+    def __contains__(self, key):
+        """
+        Return True if key is cached, without counting a hit or a miss or refreshing the entry
+
+        Returns: bool
+        """
+        return key in self._map
+
+    def stats(self):
+        """
+        Return the cache counters
+
+        Returns: dict with the number of hits, misses, evictions, the current size and maxsize
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._map),
+            "maxsize": self._maxsize,
+        }
+
+    def _evicted(self, key, value):
+        """Utility method: count an eviction and run the callback"""
+        self._evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __call__(self, func):
+        """
+        Use the cache as a memoizing decorator: @LRUCache(maxsize=256)
+
+        Arguments must be hashable. The decorated function gets a cache attribute referring to this cache.
+
+        Param func: the function to memoize
+
+        Returns: the wrapped function
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                self.put(key, value)
+            return value
+
+        wrapper.cache = self
+        return wrapper
+
+
+class LRUCache(_CacheBase):
+    """Least recently used cache: a dict of positions into a linked list kept in recency order"""
+
+    def __init__(self, maxsize=128, on_evict=None):
+        """
+        Initiate an empty LRU cache
+
+        Param maxsize: maximum number of entries, must be at least 1: default to 128
+        Param on_evict: optional function called with (key, value) of every evicted entry: default to None
+        """
+        super().__init__(maxsize, on_evict)
+        self._map = {}
+        self._order = LinkedList()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for key and mark it as most recently used, in O(1)
+
+        Param key: the key to look up
+        Param default: value returned when key is not cached: default to None
+
+        Returns: the cached value or default
+        """
+        p = self._map.get(key)
+        if p is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._order.move_to_front(p)
+        return p.element()[1]
+
+    def put(self, key, value):
+        """
+        Cache value for key as the most recently used entry, evicting the least recently used one if full, in O(1)
+
+        Returns: None (nothing)
+        """
+        order = self._order
+        p = self._map.get(key)
+        if p is not None:
+            order.replace(p, (key, value))
+            order.move_to_front(p)
+            return
+        self._map[key] = order.add_first((key, value))
+        if len(self._map) > self._maxsize:
+            old_key, old_value = order.delete(order.last_position())
+            del self._map[old_key]
+            self._evicted(old_key, old_value)
+
+    def pop(self, key, default=None):
+        """
+        Remove key from the cache without counting an eviction
+
+        Returns: the removed value or default if key is not cached
+        """
+        p = self._map.pop(key, None)
+        if p is None:
+            return default
+        return self._order.delete(p)[1]
+
+    def clear(self):
+        """
+        Remove every entry, keeping the statistics
+
+        Returns: None (nothing)
+        """
+        self._map = {}
+        self._order = LinkedList()
+
+    def keys(self):
+        """
+        Return the cached keys from the most to the least recently used
+
+        Returns: list
+        """
+        return [key for key, _ in self._order]
+
+
+class _FrequencyBucket:
+    """Entries of an LFU cache that were used the same number of times, most recent first"""
+    __slots__ = '_frequency', '_keys'
+
+    def __init__(self, frequency):
+        self._frequency = frequency
+        self._keys = LinkedList()
+
+
+class _LFUEntry:
+    """Value of an LFU cache entry with the positions of its bucket and of its key inside the bucket"""
+    __slots__ = '_value', '_bucket', '_key_position'
+
+    def __init__(self, value, bucket, key_position):
+        self._value = value
+        self._bucket = bucket
+        self._key_position = key_position
+
+
+class LFUCache(_CacheBase):
+    """
+    Least frequently used cache with O(1) operations
+
+    Entries are kept in a linked list of frequency buckets ordered by use count; each bucket is a
+    linked list of keys, so ties are evicted least recently used first.
+    """
+
+    def __init__(self, maxsize=128, on_evict=None):
+        """
+        Initiate an empty LFU cache
+
+        Param maxsize: maximum number of entries, must be at least 1: default to 128
+        Param on_evict: optional function called with (key, value) of every evicted entry: default to None
+        """
+        super().__init__(maxsize, on_evict)
+        self._map = {}
+        self._buckets = LinkedList()
+
+    def _touch(self, key, entry):
+        """Utility method: move an entry to the bucket of the next frequency"""
+        buckets = self._buckets
+        bucket_position = entry._bucket
+        bucket = bucket_position.element()
+        next_position = buckets.position_after(bucket_position)
+        if next_position is None or next_position.element()._frequency != bucket._frequency + 1:
+            if len(bucket._keys) == 1:
+                bucket._frequency += 1
+                return
+            next_position = buckets.add_after(bucket_position, _FrequencyBucket(bucket._frequency + 1))
+        bucket._keys.delete(entry._key_position)
+        entry._key_position = next_position.element()._keys.add_first(key)
+        entry._bucket = next_position
+        if bucket._keys.is_empty():
+            buckets.delete(bucket_position)
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for key and count one more use of it, in O(1)
+
+        Param key: the key to look up
+        Param default: value returned when key is not cached: default to None
+
+        Returns: the cached value or default
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._touch(key, entry)
+        return entry._value
+
+    def put(self, key, value):
+        """
+        Cache value for key, evicting the least frequently used entry if full, in O(1)
+
+        Updating a cached key counts as a use.
+
+        Returns: None (nothing)
+        """
+        entry = self._map.get(key)
+        if entry is not None:
+            entry._value = value
+            self._touch(key, entry)
+            return
+        if len(self._map) >= self._maxsize:
+            self._evict()
+        buckets = self._buckets
+        first = buckets.first_position()
+        if first is None or first.element()._frequency != 1:
+            first = buckets.add_first(_FrequencyBucket(1))
+        self._map[key] = _LFUEntry(value, first, first.element()._keys.add_first(key))
+
+    def _evict(self):
+        """Utility method: remove the least recently used key of the lowest frequency bucket"""
+        buckets = self._buckets
+        bucket_position = buckets.first_position()
+        keys = bucket_position.element()._keys
+        key = keys.delete(keys.last_position())
+        if keys.is_empty():
+            buckets.delete(bucket_position)
+        entry = self._map.pop(key)
+        self._evicted(key, entry._value)
+
+    def frequency(self, key):
+        """
+        Return the number of uses of a cached key
+
+        Returns: int, 0 if key is not cached
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            return 0
+        return entry._bucket.element()._frequency
+
+    def pop(self, key, default=None):
+        """
+        Remove key from the cache without counting an eviction
+
+        Returns: the removed value or default if key is not cached
+        """
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return default
+        keys = entry._bucket.element()._keys
+        keys.delete(entry._key_position)
+        if keys.is_empty():
+            self._buckets.delete(entry._bucket)
+        return entry._value
+
+    def clear(self):
+        """
+        Remove every entry, keeping the statistics
+
+        Returns: None (nothing)
+        """
+        self._map = {}
+        self._buckets = LinkedList()
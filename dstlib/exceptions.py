@@ -1,13 +1,21 @@
-import sys
-
-class Empty:
-    def __init__(self, msg):
-        self._msg = msg
-        print(self._msg)
-        sys.exit()
-
-class ValueError:
-    def __init__(self, msg):
-        self._msg = msg
-        print(self._msg)
-        sys.exit()
\ No newline at end of file
+import builtins
+
+class DstlibError(Exception):
+    """Base class of all the errors raised by dstlib"""
+    pass
+
+class Empty(DstlibError):
+    """Raised when reading or removing an element from an empty structure"""
+    pass
+
+class ValueError(DstlibError, builtins.ValueError):
+    """Raised when a position is not valid for the container; also a built-in ValueError"""
+    pass
+
+class Full(DstlibError):
+    """Raised when a bounded queue has no free slot before the timeout expires"""
+    pass
+
+class Closed(DstlibError):
+    """Raised when putting into a closed queue, or getting from a closed queue that has been drained"""
+    pass
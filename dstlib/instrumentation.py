@@ -0,0 +1,336 @@
+import collections
+import copyreg
+import functools
+import inspect
+import threading
+import time
+
+from .linked_list import LinkedList
+from .queue import Queue
+from .stack import Stack
+from .exceptions import ValueError
+
+# special methods counted next to the public methods
+_SPECIAL_METHODS = '__getitem__', '__contains__', '__iter__', '__reversed__'
+# operations that link new nodes into the structure; their allocations are the growth of the length
+_ALLOCATING = frozenset([
+    'append', 'prepend', 'add_first', 'add_last', 'add_before', 'add_after', 'insert', 'insort',
+    'extend', 'extendleft', 'enqueue', 'enqueue_many', 'enqueue_position', 'push', 'push_many', 'push_position',
+    'put', 'put_many',
+])
+_MISSING = object()
+
+# Instrumentation enabled by instrument_all(), and the methods it replaced in every class
+_global = None
+_patched = {}
+
+
+def _bucket(value):
+    """Utility function: the power of two histogram bucket holding value, by its upper bound"""
+    return 1 << value.bit_length()
+
+
+class _CallState(threading.local):
+    """Call nesting of one thread: a thread blocked inside an operation must not hide the calls of the others"""
+    # set while an operation is counted, the methods it calls are not counted again
+    depth = 0
+    # set while the length of an allocating operation is watched, so nested ones are not added twice
+    sizing = False
+
+
+class Instrumentation:
+    """
+    Counters collected from the structures it is attached to with instrument() or instrument_all()
+
+    The operation counters only count calls made from outside the structures, a method called by
+    another method of an instrumented structure is not counted again, but the nodes it allocates
+    are, e.g. those of Queue.concat(). The nesting is followed per thread, so the calls of every
+    thread are counted, but the counters are updated without a lock: they may miss an increment made
+    at the same time by another thread, and the allocations, counted from the growth of the length,
+    miss the nodes another thread removes during the operation.
+    """
+
+    def __init__(self, latency=False):
+        """
+        Initiate empty counters
+
+        Param latency: if True, also record a histogram of the latency of every operation: default to False
+        """
+        self._latency = latency
+        self._hooks = []
+        # operations are timed for the latency histograms or for the hooks
+        self._timed = latency
+        self._state = _CallState()
+        self.reset()
+
+    def reset(self):
+        """
+        Set every counter back to zero, keeping the hooks
+
+        Returns: None (nothing)
+        """
+        self._calls = collections.Counter()
+        self._allocations = 0
+        self._walks = 0
+        self._traversed = 0
+        self._max_traversal = 0
+        self._traversals = collections.Counter()
+        self._latencies = collections.defaultdict(collections.Counter)
+
+    def add_hook(self, hook):
+        """
+        Register a function called after every counted operation, e.g. to forward it to an external profiler
+
+        Param hook: function called with (operation, structure, elapsed_ns), operation being e.g. "LinkedList.append"
+
+        Returns: None (nothing)
+        """
+        self._hooks.append(hook)
+        self._timed = True
+
+    def remove_hook(self, hook):
+        """
+        Unregister a function registered with add_hook
+
+        Returns: None (nothing)
+        """
+        self._hooks.remove(hook)
+        self._timed = self._latency or bool(self._hooks)
+
+    def _record(self, operation, structure, elapsed):
+        """Utility method: add the latency of an operation to its histogram and run the hooks"""
+        if self._latency:
+            self._latencies[operation][_bucket(elapsed)] += 1
+        for hook in self._hooks:
+            hook(operation, structure, elapsed)
+
+    def _walked(self, steps):
+        """Utility method: count an indexed access that walked the giving number of nodes"""
+        self._walks += 1
+        self._traversed += steps
+        self._traversals[_bucket(steps)] += 1
+        if steps > self._max_traversal:
+            self._max_traversal = steps
+
+    def stats(self):
+        """
+        Return a snapshot of the counters
+
+        Returns: dict with the calls per operation, the number of allocated nodes, the number of indexed
+        accesses that walked the list with the nodes traversed (total, mean, max and a histogram by power of
+        two upper bound) and, if enabled, the latency histogram of every operation in nanoseconds
+        """
+        stats = {
+            "calls": dict(self._calls),
+            "allocations": self._allocations,
+            "indexed_walks": self._walks,
+            "nodes_traversed": self._traversed,
+            "mean_traversal": self._traversed / self._walks if self._walks else 0.0,
+            "max_traversal": self._max_traversal,
+            "traversal_histogram": dict(sorted(self._traversals.items())),
+        }
+        if self._latency:
+            stats["latency_ns"] = {operation: dict(sorted(histogram.items()))
+                                   for operation, histogram in self._latencies.items()}
+        return stats
+
+
+def _operation_names(cls):
+    """Utility function: names of the public methods and counted special methods of a class"""
+    names = []
+    for name in dir(cls):
+        if name.startswith('_') and name not in _SPECIAL_METHODS:
+            continue
+        if inspect.isfunction(inspect.getattr_static(cls, name)):
+            names.append(name)
+    return names
+
+
+def _walk_length(L, i, max_index):
+    """Utility function: number of nodes _get_current_node will walk to reach index i of a list without skip list"""
+    steps = i if i <= max_index - i else max_index - i
+    if L._finger is not None:
+        steps = min(steps, abs(i - L._finger_index))
+    return steps
+
+
+def _wrap_operation(base, name, method, resolve):
+    """Utility function: wrap a method of base so that calls are counted by the instrumentation resolve(self) returns"""
+    operation = '%s.%s' % (base.__name__, name)
+    allocating = name in _ALLOCATING
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = resolve(self)
+        if instrumentation is None:
+            return method(self, *args, **kwargs)
+        state = instrumentation._state
+        counted = not state.depth
+        sized = allocating and not state.sizing
+        if not (counted or sized):
+            return method(self, *args, **kwargs)
+        if counted:
+            instrumentation._calls[operation] += 1
+            state.depth = 1
+        if sized:
+            size = len(self)
+            state.sizing = True
+        timed = counted and instrumentation._timed
+        if timed:
+            start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if timed:
+                elapsed = time.perf_counter_ns() - start
+            if counted:
+                state.depth = 0
+            if sized:
+                state.sizing = False
+                size = len(self) - size
+                if size > 0:
+                    instrumentation._allocations += size
+            if timed:
+                instrumentation._record(operation, self, elapsed)
+    return wrapper
+
+
+def _wrap_walk(method, resolve):
+    """Utility function: wrap _get_current_node so that the nodes it walks are counted"""
+
+    @functools.wraps(method)
+    def wrapper(self, i, max_index):
+        instrumentation = resolve(self)
+        if instrumentation is not None and self._index is None:
+            instrumentation._walked(_walk_length(self, i, max_index))
+        return method(self, i, max_index)
+    return wrapper
+
+
+def _original_method(base, name):
+    """Utility function: the method name of base as defined in the classes, ignoring the instrument_all patches"""
+    for cls in base.__mro__:
+        originals = _patched.get(cls, {})
+        if name in originals:
+            if originals[name] is not _MISSING:
+                return originals[name]
+        elif name in cls.__dict__:
+            return cls.__dict__[name]
+    raise AttributeError(name)
+
+
+def _new_instance(cls, *args):
+    """Utility function: a new instance of cls whose state is then restored by pickle or copy"""
+    return cls.__new__(cls, *args)
+
+
+def _instrumented_class(base, instrumentation):
+    """Utility function: a subclass of base whose methods count calls into the giving instrumentation"""
+    def resolve(structure):
+        return instrumentation
+
+    def __reduce_ex__(self, protocol):
+        # pickled and copied as an instance of base, the generated class cannot be looked up by name
+        reduced = base.__reduce_ex__(self, protocol)
+        if not isinstance(reduced, tuple) or reduced[0] is not copyreg.__newobj__:
+            return reduced
+        return (_new_instance, (base,) + reduced[1][1:]) + reduced[2:]
+
+    namespace = {'_instrumentation': instrumentation, '__module__': base.__module__, '__qualname__': base.__qualname__,
+                 '__reduce_ex__': __reduce_ex__}
+    for name in _operation_names(base):
+        namespace[name] = _wrap_operation(base, name, _original_method(base, name), resolve)
+    if hasattr(base, '_get_current_node'):
+        namespace['_get_current_node'] = _wrap_walk(_original_method(base, '_get_current_node'), resolve)
+    return type(base.__name__, (base,), namespace)
+
+
+def instrument(structure, latency=False):
+    """
+    Start counting the operations of one structure
+
+    The structure's class is switched to a subclass counting into a new Instrumentation, other
+    instances keep running the plain methods at no cost. Lists made by partition() of the structure
+    share its instrumentation, pickles and copies of the structure are not instrumented. The
+    structure is counted by its own instrumentation only, not by instrument_all(). Calling it
+    again on an instrumented structure returns its instrumentation.
+
+    Param structure: a LinkedList, Queue, Stack or other dstlib structure
+    Param latency: if True, also record latency histograms: default to False
+
+    Returns: the Instrumentation collecting the counters of the structure
+    """
+    instrumentation = type(structure).__dict__.get('_instrumentation')
+    if instrumentation is None:
+        instrumentation = Instrumentation(latency)
+        structure.__class__ = _instrumented_class(type(structure), instrumentation)
+    return instrumentation
+
+
+def uninstrument(structure):
+    """
+    Stop counting the operations of a structure instrumented with instrument()
+
+    Returns: the Instrumentation that was collecting its counters, or None if it was not instrumented
+    """
+    cls = type(structure)
+    instrumentation = cls.__dict__.get('_instrumentation')
+    if instrumentation is not None:
+        structure.__class__ = cls.__bases__[0]
+    return instrumentation
+
+
+def _global_instrumentation(structure):
+    """Utility function: the Instrumentation of instrument_all(), or None once it was disabled"""
+    return _global
+
+
+def instrument_all(classes=(LinkedList, Queue, Stack), latency=False):
+    """
+    Start counting the operations of every instance, existing or new, of the giving classes
+
+    The methods of the classes are replaced by counting wrappers until uninstrument_all() puts
+    the original methods back, so nothing is paid while it is off.
+
+    Param classes: the classes to instrument: default to (LinkedList, Queue, Stack)
+    Param latency: if True, also record latency histograms: default to False
+
+    Returns: the Instrumentation shared by all the instances
+    """
+    global _global
+    if _global is not None:
+        raise ValueError("instrument_all() is already enabled, call uninstrument_all() first")
+    _global = Instrumentation(latency)
+    for cls in classes:
+        names = _operation_names(cls)
+        if hasattr(cls, '_get_current_node'):
+            names.append('_get_current_node')
+        originals = _patched[cls] = {}
+        for name in names:
+            originals[name] = cls.__dict__.get(name, _MISSING)
+            method = getattr(cls, name)
+            if name == '_get_current_node':
+                wrapper = _wrap_walk(method, _global_instrumentation)
+            else:
+                wrapper = _wrap_operation(cls, name, method, _global_instrumentation)
+            setattr(cls, name, wrapper)
+    return _global
+
+
+def uninstrument_all():
+    """
+    Put back the original methods of the classes instrumented with instrument_all()
+
+    Returns: the Instrumentation that was collecting the counters, or None if it was not enabled
+    """
+    global _global
+    instrumentation = _global
+    for cls, originals in _patched.items():
+        for name, original in originals.items():
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+    _patched.clear()
+    _global = None
+    return instrumentation
@@ -1,18 +1,109 @@
+import heapq
+
 from .node import Node
-from .utils import _Position
+from .utils import _NodePosition
+from .skip_index import _SkipIndex
 from .exceptions import ValueError
-import math
+
+_NO_KEY = object()
+
+
+def _element_of(node):
+    """Utility function: the element of a node, used as a sort key"""
+    return node._element
+
+
+class _SliceView:
+    """Lazy view over a slice of a linked list, walking the nodes once per iteration without copying"""
+    __slots__ = '_list', '_range', '_mod_count'
+
+    def __init__(self, L, s):
+        """
+        Initiate a view over the elements of the linked list L selected by the slice s
+
+        Param L: the linked list
+        Param s: slice object, normalized against the current length of L
+        """
+        self._list = L
+        self._range = range(*s.indices(len(L)))
+        self._mod_count = L._mod_count
+
+    def __len__(self):
+        """
+        Return the number of elements in the view
+
+        Returns: int
+        """
+        return len(self._range)
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over the view
+
+        Raises RuntimeError if the linked list was structurally modified since the view was created.
+
+        Returns: None (nothing)
+        """
+        return self._walk(self._range)
+
+    def __reversed__(self):
+        """
+        Special method (iterator) to iterate over the view from its end
+
+        Returns: None (nothing)
+        """
+        return self._walk(self._range[::-1])
+
+    def _walk(self, indices):
+        """Utility method: yield the elements at the giving range of indices, stepping through the nodes"""
+        L = self._list
+        mod_count = self._mod_count
+        if L._mod_count != mod_count:
+            raise RuntimeError("linked list changed after the slice view was created")
+        count = len(indices)
+        if count == 0:
+            return
+        node = L._get_current_node(indices[0], L._size - 1)
+        step = indices.step
+        while True:
+            yield node._element
+            if L._mod_count != mod_count:
+                raise RuntimeError("linked list changed during iteration")
+            count -= 1
+            if count == 0:
+                return
+            if step > 0:
+                for _ in range(step):
+                    node = node._next
+            else:
+                for _ in range(-step):
+                    node = node._prev
+
 
 class _DoubleLinkedBase:
     """A base class providing a doubly linked list representation"""
 
-    def __init__(self):
-        """Initiate an empty linked list with two sentinel nodes (head & tail)."""
+    def __init__(self, indexed=False, pool=None, index_values=False):
+        """
+        Initiate an empty linked list with two sentinel nodes (head & tail).
+
+        Param indexed: if True, maintain an indexable skip list over the nodes so that indexed
+        access, insertion, deletion and index_of run in expected O(log n): default to False
+        Param pool: optional NodePool that deleted nodes are returned to and new nodes are taken from: default to None
+        Param index_values: if True, maintain a hash index from every value to its nodes so that
+        membership and search by value run in O(1); the elements must then be hashable: default to False
+        """
         self._head = Node(None, None)
         self._tail = Node(None, None)
         self._head._next = self._tail
         self._tail._prev = self._head
         self._size = 0
+        self._finger = None
+        self._finger_index = 0
+        self._index = _SkipIndex(self) if indexed else None
+        self._mod_count = 0
+        self._pool = pool
+        self._values = {} if index_values else None
 
     def __len__(self):
         """
@@ -23,7 +114,9 @@ class _DoubleLinkedBase:
         return self._size
 
     def __getitem__(self, i):
-        """Return element at index i"""
+        """Return element at index i, or a lazy _SliceView over the elements if i is a slice"""
+        if isinstance(i, slice):
+            return _SliceView(self, i)
         if not 0 <= i < self._size:
             raise IndexError("invalid index")
         
@@ -36,6 +129,123 @@ class _DoubleLinkedBase:
         current_node = self._get_current_node(i, max_index)
         return current_node._element
 
+    def __iter__(self):
+        """
+        Special method (iterator) to allow iterating over the linked list by walking the nodes
+
+        Raises RuntimeError if the list is structurally modified during the iteration.
+
+        Returns: None (nothing)
+        """
+        mod_count = self._mod_count
+        tail = self._tail
+        node = self._head._next
+        while node is not tail:
+            yield node._element
+            if self._mod_count != mod_count:
+                raise RuntimeError("linked list changed during iteration")
+            node = node._next
+
+    def __reversed__(self):
+        """
+        Special method (iterator) to allow iterating over the linked list from the end by walking the nodes
+
+        Raises RuntimeError if the list is structurally modified during the iteration.
+
+        Returns: None (nothing)
+        """
+        mod_count = self._mod_count
+        head = self._head
+        node = self._tail._prev
+        while node is not head:
+            yield node._element
+            if self._mod_count != mod_count:
+                raise RuntimeError("linked list changed during iteration")
+            node = node._prev
+
+    def islice(self, *args):
+        """
+        Return a lazy view over a slice of the linked list, like itertools.islice
+
+        Example: L.islice(10) is L[:10] and L.islice(2, None, 3) is L[2::3]
+
+        Returns: _SliceView object
+        """
+        return _SliceView(self, slice(*args))
+
+    def _iter_nodes(self):
+        """Utility method: yield the nonsentinel nodes in list order"""
+        tail = self._tail
+        node = self._head._next
+        while node is not tail:
+            next_node = node._next
+            yield node
+            node = next_node
+
+    def __contains__(self, value):
+        """
+        Return True if an element of the linked list is equal to value, without creating positions
+
+        Returns: bool: O(1) with a value index, O(n) otherwise
+        """
+        if self._values is not None:
+            return value in self._values
+        return self._find_node(value) is not None
+
+    def _find_node(self, value):
+        """
+        Utility method: return the first node (in list order) whose element is equal to value
+
+        With a value index this is O(1) for a value held once; for a value held several times the
+        candidates are ranked through the skip index, or the list is walked until one is reached.
+
+        Returns: the node, or None if no element is equal to value
+        """
+        tail = self._tail
+        values = self._values
+        if values is None:
+            node = self._head._next
+            while node is not tail:
+                if node._element == value:
+                    return node
+                node = node._next
+            return None
+        nodes = values.get(value)
+        if nodes is None:
+            return None
+        if len(nodes) == 1:
+            return next(iter(nodes))
+        if self._index is not None:
+            return min(nodes, key=self._index.rank)
+        node = self._head._next
+        while node not in nodes:
+            node = node._next
+        return node
+
+    def _node_index(self, node):
+        """Utility method: return the index of a nonsentinel node, O(log n) expected for an indexed list, O(n) otherwise"""
+        if self._index is not None:
+            return self._index.rank(node)
+        i = 0
+        node = node._prev
+        while node is not self._head:
+            node = node._prev
+            i += 1
+        return i
+
+    def _add_value(self, node):
+        """Utility method: record a linked node in the value index"""
+        self._values.setdefault(node._element, {})[node] = None
+
+    def _discard_value(self, node):
+        """Utility method: drop a node from the value index"""
+        values = self._values
+        el = node._element
+        nodes = values[el]
+        del nodes[node]
+        if not nodes:
+            del values[el]
+
     def _delete_node(self, node):
         """
         Delete nonsentinel node from the linked list and return its element
@@ -44,13 +254,37 @@ class _DoubleLinkedBase:
 
         Returns: deleted node value
         """
+        if self._index is not None:
+            self._index.remove(node)
+        if self._values is not None:
+            self._discard_value(node)
         prev_node = node._prev
         next_node = node._next
         prev_node._next = next_node
         next_node._prev = prev_node
+        finger = self._finger
+        if finger is not None:
+            if node is finger:
+                if prev_node is not self._head:
+                    self._finger = prev_node
+                    self._finger_index -= 1
+                elif next_node is not self._tail:
+                    self._finger = next_node
+                else:
+                    self._finger = None
+            elif next_node is self._tail or prev_node is finger:
+                pass
+            elif prev_node is self._head or next_node is finger:
+                self._finger_index -= 1
+            else:
+                self._finger = None
         removed_element = node._element
-        node._prev = node._next = node._element = None
+        if self._pool is not None:
+            self._pool.release(node)
+        else:
+            node._prev = node._next = node._element = None
         self._size -= 1
+        self._mod_count += 1
         return removed_element
 
     def _insert_between(self, el, predecessor, successor):
@@ -63,12 +297,121 @@ class _DoubleLinkedBase:
 
         Returns: the inserted node
         """
-        new_node = Node(el, successor, predecessor)
+        pool = self._pool
+        new_node = Node(el, successor, predecessor) if pool is None else pool.acquire(el, successor, predecessor)
+        if self._values is not None:
+            self._add_value(new_node)
         predecessor._next = new_node
         successor._prev = new_node
         self._size += 1
+        self._mod_count += 1
+        if self._index is not None:
+            self._index.insert(new_node)
+        finger = self._finger
+        if finger is not None:
+            if successor is self._tail or predecessor is finger:
+                pass
+            elif predecessor is self._head or successor is finger:
+                self._finger_index += 1
+            else:
+                self._finger = None
         return new_node
 
+    def _splice_between(self, other, predecessor, successor):
+        """
+        Move every node of another linked list in between two given nodes predecessor & successor in O(1)
+
+        The nodes are relinked, not copied, and the other list is left empty. An indexed list
+        rebuilds its index afterwards, which costs O(n).
+
+        Param other: the linked list whose nodes are moved
+        Param predecessor: the node that will be before the moved nodes
+        Param successor: the node that will be after the moved nodes
+
+        Returns: None (nothing)
+        """
+        if other is self:
+            raise ValueError("cannot splice a linked list into itself")
+        count = other._size
+        if count == 0:
+            return
+        first = other._head._next
+        last = other._tail._prev
+        if self._values is not None:
+            self._adopt_values(other)
+        predecessor._next = first
+        first._prev = predecessor
+        last._next = successor
+        successor._prev = last
+        self._size += count
+        self._mod_count += 1
+        other._forget_nodes()
+
+        finger = self._finger
+        if finger is not None:
+            if successor is self._tail or predecessor is finger:
+                pass
+            elif predecessor is self._head or successor is finger:
+                self._finger_index += count
+            else:
+                self._finger = None
+        if self._index is not None:
+            self._index.rebuild()
+
+    def _adopt_values(self, *others):
+        """Utility method: add every node of other lists, about to be moved into this list, to the value index"""
+        moved = []
+        for other in others:
+            other_values = other._values
+            if other_values is None:
+                other_values = {}
+                for node in other._iter_nodes():
+                    other_values.setdefault(node._element, {})[node] = None
+            moved.append(other_values)
+        values = self._values
+        for other_values in moved:
+            for el, nodes in other_values.items():
+                values.setdefault(el, {}).update(nodes)
+
+    def _forget_nodes(self):
+        """Utility method: leave the list empty after all its nodes were moved to another list"""
+        self._head._next = self._tail
+        self._tail._prev = self._head
+        self._size = 0
+        self._finger = None
+        self._mod_count += 1
+        if self._values is not None:
+            self._values = {}
+        if self._index is not None:
+            self._index.rebuild()
+
+    def _move_node(self, node, predecessor, successor):
+        """
+        Relink a nonsentinel node of the list in between two given nodes predecessor & successor in O(1)
+
+        The node itself is kept, so positions referring to it stay valid.
+
+        Param node: the node to be moved
+        Param predecessor: the node that will be before the moved node
+        Param successor: the node that will be after the moved node
+
+        Returns: None (nothing)
+        """
+        if node is predecessor or node is successor:
+            return
+        if self._index is not None:
+            self._index.remove(node)
+        node._prev._next = node._next
+        node._next._prev = node._prev
+        node._prev = predecessor
+        node._next = successor
+        predecessor._next = node
+        successor._prev = node
+        self._finger = None
+        self._mod_count += 1
+        if self._index is not None:
+            self._index.insert(node)
+
     def is_empty(self):
         """
         Return True if list is empty
@@ -85,10 +428,7 @@ class _DoubleLinkedBase:
 
         Returns: None (nothing)
         """
-        new_node = Node(el, self._tail, self._tail._prev)
-        self._tail._prev._next = new_node
-        self._tail._prev = new_node
-        self._size += 1
+        _DoubleLinkedBase._insert_between(self, el, self._tail._prev, self._tail)
 
     def prepend(self, el):
         """
@@ -98,10 +438,193 @@ class _DoubleLinkedBase:
 
         returns: None (nothing)
         """
-        new_node = Node(el, self._head._next, self._head)
-        self._head._next._prev = new_node
-        self._head._next = new_node
-        self._size += 1
+        _DoubleLinkedBase._insert_between(self, el, self._head, self._head._next)
+
+    def extend(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the linked list
+
+        The new nodes are chained in one pass and the size is updated once. An indexed list
+        rebuilds its index afterwards.
+
+        Param iterable: elements (values) to be added
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        pool = self._pool
+        values = self._values
+        tail = self._tail
+        prev_node = tail._prev
+        count = 0
+        try:
+            for el in iterable:
+                node = Node(el, None, prev_node) if pool is None else pool.acquire(el, None, prev_node)
+                if values is not None:
+                    self._add_value(node)
+                prev_node._next = node
+                prev_node = node
+                count += 1
+        finally:
+            prev_node._next = tail
+            tail._prev = prev_node
+            if count:
+                self._size += count
+                self._mod_count += 1
+                if self._index is not None:
+                    self._index.rebuild()
+
+    def extendleft(self, iterable):
+        """
+        Add all the elements of a giving iterable to the front of the linked list, one after the other
+
+        Like collections.deque.extendleft, the added elements end up in reverse order. The new
+        nodes are chained in one pass and the size is updated once.
+
+        Param iterable: elements (values) to be added
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        pool = self._pool
+        values = self._values
+        head = self._head
+        next_node = head._next
+        count = 0
+        try:
+            for el in iterable:
+                node = Node(el, next_node, None) if pool is None else pool.acquire(el, next_node, None)
+                if values is not None:
+                    self._add_value(node)
+                next_node._prev = node
+                next_node = node
+                count += 1
+        finally:
+            next_node._prev = head
+            head._next = next_node
+            if count:
+                self._size += count
+                self._mod_count += 1
+                if self._finger is not None:
+                    self._finger_index += count
+                if self._index is not None:
+                    self._index.rebuild()
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a linked list holding the elements of a giving iterable in one pass
+
+        Param iterable: elements (values) of the new list
+        Param kwargs: keyword arguments of the constructor (indexed, pool, index_values)
+
+        Returns: the new linked list
+        """
+        L = cls(**kwargs)
+        L.extend(iterable)
+        return L
+
+    def _filter_nodes(self, pred, target=None):
+        """
+        Utility method: unlink, in one pass, every node whose element satisfies pred
+
+        The list stays consistently linked after every step, so an exception raised by pred
+        leaves the nodes unlinked so far removed and the others in place.
+
+        Param pred: one-argument function called with every element, in list order
+        Param target: an empty list of the same kind that the unlinked nodes are appended to in order,
+        or None to discard them: default to None
+
+        Returns: int: the number of unlinked nodes
+        """
+        tail = self._tail
+        pool = self._pool
+        values = self._values
+        prev_node = self._head
+        node = prev_node._next
+        removed = 0
+        try:
+            while node is not tail:
+                next_node = node._next
+                if not pred(node._element):
+                    prev_node = node
+                    node = next_node
+                    continue
+                if values is not None:
+                    self._discard_value(node)
+                prev_node._next = next_node
+                next_node._prev = prev_node
+                removed += 1
+                if target is not None:
+                    target_tail = target._tail
+                    last = target_tail._prev
+                    node._prev = last
+                    node._next = target_tail
+                    last._next = node
+                    target_tail._prev = node
+                    if target._values is not None:
+                        target._add_value(node)
+                elif pool is not None:
+                    pool.release(node)
+                else:
+                    node._prev = node._next = node._element = None
+                node = next_node
+        finally:
+            if removed:
+                self._size -= removed
+                self._mod_count += 1
+                self._finger = None
+                if self._index is not None:
+                    self._index.rebuild()
+                if target is not None:
+                    target._size += removed
+                    target._mod_count += 1
+                    if target._index is not None:
+                        target._index.rebuild()
+        return removed
+
+    def remove_if(self, pred):
+        """
+        Delete every element satisfying a giving predicate in a single O(n) pass
+
+        Param pred: one-argument function returning True for the elements to delete
+
+        Returns: int: the number of deleted elements
+        """
+        return self._filter_nodes(pred)
+
+    def dedupe(self, key=None, consecutive=False):
+        """
+        Delete duplicate elements in a single O(n) pass, keeping the first element of every group of equal ones
+
+        Param key: optional one-argument function used to extract the compared value from each element
+        Param consecutive: if True, only delete elements equal to the element right before them (like uniq);
+        otherwise delete every element equal to an earlier one, which requires hashable values: default to False
+
+        Returns: int: the number of deleted elements
+        """
+        if consecutive:
+            previous = _NO_KEY
+
+            def is_duplicate(el):
+                nonlocal previous
+                k = el if key is None else key(el)
+                if previous is not _NO_KEY and previous == k:
+                    return True
+                previous = k
+                return False
+        else:
+            seen = set()
+
+            def is_duplicate(el):
+                k = el if key is None else key(el)
+                if k in seen:
+                    return True
+                seen.add(k)
+                return False
+        return self._filter_nodes(is_duplicate)
 
     def insert(self, i, el):
         """
@@ -118,11 +641,7 @@ class _DoubleLinkedBase:
             self.append(el)
         else:
             current_node = self._get_current_node(i, max_index)
-            prev_node = current_node._prev
-            new_node = Node(el, current_node, prev_node)
-            prev_node._next = new_node
-            current_node._prev = new_node
-            self._size += 1
+            _DoubleLinkedBase._insert_between(self, el, current_node._prev, current_node)
 
     def reverse(self):
         """
@@ -130,41 +649,62 @@ class _DoubleLinkedBase:
 
         Returns: None (nothing)
         """
-        temp = None
+        if self._size < 2:
+            return
+        self._mod_count += 1
+        if self._finger is not None:
+            self._finger_index = self._size - 1 - self._finger_index
         initial_first = self._head._next
+        initial_last = self._tail._prev
         current = initial_first
-        while current is not None:
-            temp = current._prev
-            current._prev = current._next
-            current._next = temp
-            current = current._prev
-
-        if temp is not None:
-            self._head._next = temp
-
-        self._tail._next = None
-        initial_first._next = self._tail
+        while current is not self._tail:
+            next_node = current._next
+            current._next = current._prev
+            current._prev = next_node
+            current = next_node
+
+        self._head._next = initial_last
+        initial_last._prev = self._head
         self._tail._prev = initial_first
-        self._head._prev = None
+        initial_first._next = self._tail
+        if self._index is not None:
+            self._index.rebuild()
 
     def _get_current_node(self, i, max_index):
-        """Utility method"""
-        mid = math.ceil(max_index/2)
-        if i <= mid:
-            count = 0
+        """
+        Utility method: return the node at index i
+
+        The walk starts from whichever of the head, the tail or the finger (the node
+        reached by the previous indexed lookup) is closest to i, and the finger is then
+        moved to the returned node, so nearby indexed accesses cost O(distance).
+
+        Param i: index of the node, 0 <= i <= max_index
+        Param max_index: index of the last node in the list
+
+        Returns: the node at index i
+        """
+        if self._index is not None:
+            return self._index.select(i)
+        if i <= max_index - i:
             current_node = self._head._next
-            while count != i:
-                next_node = current_node._next
-                count += 1
-                current_node = next_node
+            count = 0
         else:
-            count = max_index
             current_node = self._tail._prev
-            while count != i:
-                prev_node = current_node._prev
-                count -= 1
-                current_node = prev_node
-
+            count = max_index
+        finger = self._finger
+        if finger is not None and abs(i - self._finger_index) < abs(i - count):
+            current_node = finger
+            count = self._finger_index
+
+        while count < i:
+            current_node = current_node._next
+            count += 1
+        while count > i:
+            current_node = current_node._prev
+            count -= 1
+
+        self._finger = current_node
+        self._finger_index = i
         return current_node
 
 
@@ -172,23 +712,30 @@ class _DoubleLinkedBase:
 class LinkedList(_DoubleLinkedBase):
     """Position based linked list implementation using doubly linked list base class"""
 
-    class Position(_Position):
-        """extension of the inherited _Position class for positioning of nodes"""
+    class Position(_NodePosition):
+        """extension of the inherited _NodePosition class for positioning of nodes"""
+        __slots__ = '_epoch',
+
+        def __init__(self, container, node):
+            self._container = container
+            self._node = node
+            self._generation = node._generation
+            self._epoch = container._epoch
 
         def _get_key(self):
             """Returns the identifier of the current position"""
             return id(self)
-        
-    def __iter__(self):
+
+    def __init__(self, indexed=False, pool=None, index_values=False):
         """
-        Special method (iterator) to allow iterating over the linked list
+        Initiate an empty position based linked list
 
-        Returns: None (nothing)
+        Param indexed: if True, indexed access, insertion, deletion and index_of run in expected O(log n): default to False
+        Param pool: optional NodePool shared with other structures to reuse deleted nodes: default to None
+        Param index_values: if True, membership, find and remove by value run in O(1) (elements must be hashable): default to False
         """
-        position = self.first_position()
-        while position is not None:
-            yield position.element()
-            position = self.position_after(position)
+        super().__init__(indexed, pool, index_values)
+        self._epoch = 0
 
     def _get_position(self, node):
         """
@@ -219,7 +766,7 @@ class LinkedList(_DoubleLinkedBase):
             raise TypeError("improper Position")
         if p._container is not self:
             raise ValueError("position does not belong to this container")
-        if p._node._next == None:
+        if p._node._next == None or p._epoch != self._epoch or p._generation != p._node._generation:
             raise ValueError("position is no longer valid")
         return p._node
 
@@ -253,6 +800,16 @@ class LinkedList(_DoubleLinkedBase):
         node = self._validate(p)
         return self._get_position(node._prev)
 
+    def index_of(self, p):
+        """
+        Returns the index of the element at the giving position
+
+        Param p: a position object
+
+        Returns: int: O(log n) expected for an indexed list, O(n) otherwise
+        """
+        return self._node_index(self._validate(p))
+
     def add_first(self, el):
         """
         Add a giving element to the front of the linked list
@@ -299,6 +856,58 @@ class LinkedList(_DoubleLinkedBase):
         node = self._validate(p)
         return self._insert_between(el, node, node._next)
 
+    def move_to_front(self, p):
+        """
+        Move the element at a giving position to the front of the linked list in O(1), keeping the position valid
+
+        Param p: the position of the element to be moved
+
+        Returns: None (nothing)
+        """
+        node = self._validate(p)
+        self._move_node(node, self._head, self._head._next)
+
+    def move_to_back(self, p):
+        """
+        Move the element at a giving position to the end of the linked list in O(1), keeping the position valid
+
+        Param p: the position of the element to be moved
+
+        Returns: None (nothing)
+        """
+        node = self._validate(p)
+        self._move_node(node, self._tail._prev, self._tail)
+
+    def move_before(self, p, q):
+        """
+        Move the element at position p right before the element at position q in O(1), keeping p valid
+
+        Param p: the position of the element to be moved
+        Param q: the position to move the element before
+
+        Returns: None (nothing)
+        """
+        node = self._validate(p)
+        target = self._validate(q)
+        if node is target:
+            raise ValueError("cannot move a position relative to itself")
+        self._move_node(node, target._prev, target)
+
+    def move_after(self, p, q):
+        """
+        Move the element at position p right after the element at position q in O(1), keeping p valid
+
+        Param p: the position of the element to be moved
+        Param q: the position to move the element after
+
+        Returns: None (nothing)
+        """
+        node = self._validate(p)
+        target = self._validate(q)
+        if node is target:
+            raise ValueError("cannot move a position relative to itself")
+        self._move_node(node, target, target._next)
+
     def delete(self, p):
         """
         Deletes element at a giving position
@@ -320,36 +929,221 @@ class LinkedList(_DoubleLinkedBase):
         Returns position object
         """
         node = self._validate(p)
+        values = self._values
+        if values is not None:
+            hash(el)
+            self._discard_value(node)
         node._element = el
+        if values is not None:
+            self._add_value(node)
         return p
 
+    def find(self, value):
+        """
+        Returns the position of the first element equal to the giving value
+
+        Param value: the value to search for
+
+        Returns: position object, or None if no element is equal to value; O(1) with a value index for a value held once, O(n) otherwise
+        """
+        return self._get_position(self._find_node(value) or self._tail)
+
+    def index(self, value):
+        """
+        Returns the index of the first element equal to the giving value
+
+        Param value: the value to search for
+
+        Returns: int; raises ValueError if no element is equal to value
+        """
+        node = self._find_node(value)
+        if node is None:
+            raise ValueError("value is not in the linked list")
+        return self._node_index(node)
+
+    def remove(self, value):
+        """
+        Deletes the first element equal to the giving value
+
+        Param value: the value to delete
+
+        Returns: None (nothing); raises ValueError if no element is equal to value
+        """
+        node = self._find_node(value)
+        if node is None:
+            raise ValueError("value is not in the linked list")
+        self._delete_node(node)
+
+    def partition(self, pred):
+        """
+        Move every element satisfying a giving predicate into a new linked list in a single O(n) pass
+
+        The nodes are relinked, not copied, and keep their relative order in both lists. The new list
+        has the same indexed, pool and index_values settings. Positions obtained from the current
+        linked list are no longer valid.
+
+        Param pred: one-argument function returning True for the elements to move
+
+        Returns: the new linked list holding the moved elements
+        """
+        L = type(self)(indexed=self._index is not None, pool=self._pool, index_values=self._values is not None)
+        try:
+            self._filter_nodes(pred, L)
+        finally:
+            if L._size:
+                self._epoch += 1
+        return L
+
     def concat(self, L):
         """
         Join a giving linked list to the current linked list from the end of the current linked list and destroy the giving linked list
 
-        Param Q: a linked list object to join with the current linked list
+        The nodes of L are relinked in O(1) and L is left empty. Positions obtained from L are no longer valid.
+
+        Param L: a linked list object to join with the current linked list
+
+        Returns: None
+        """
+        self.splice(None, L)
+
+    def splice(self, p, L):
+        """
+        Move all the elements of a giving linked list before the giving position and destroy the giving linked list
+
+        The nodes of L are relinked in O(1) and L is left empty. Positions obtained from L are no longer valid.
+
+        Param p: the position to insert the elements before, or None to insert them at the end
+        Param L: a linked list object whose elements are moved into the current linked list
 
         Returns: None
         """
+        if p is None:
+            node = self._tail
+        else:
+            node = self._validate(p)
+        if not isinstance(L, LinkedList):
+            raise TypeError("can only splice a LinkedList")
         if L.is_empty():
             return
-        for el in L:
-            p = self.add_last(el, no_return=True)
-
-    def sort(self):
-        """Sort Linked List of comparable elements into nondecreasing order using insertion sort algorithm"""
-        if len(self) > 1:
-            first_position = self.first_position()
-            marker = first_position
-            while marker != self.last_position() and self.position_after(marker) != None:
-                pivot = self.position_after(marker)
-                pivot_value = pivot.element()
-                if pivot_value > marker.element():
-                    marker = pivot
-                else:
-                    walk = marker
-                    while self.position_before(walk) != None and walk._get_key() != first_position._get_key() and self.position_before(walk).element() > pivot_value:
-                        walk = self.position_before(walk)
+        self._splice_between(L, node._prev, node)
+        L._epoch += 1
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the linked list in place using a stable O(n log n) sort
+
+        The nodes are collected into a Python list, sorted there with the built-in stable
+        list.sort and relinked only once the sort succeeded, so a key or a comparison that
+        raises leaves the list unchanged. The existing nodes are relinked rather than copied,
+        so positions held by the caller stay valid and keep referring to the same elements.
+
+        Param key: optional one-argument function used to extract a comparison key from each element
+        Param reverse: if True, sort into nonincreasing order (equal elements keep their relative order)
+
+        Returns: None (nothing)
+        """
+        if self._size < 2:
+            return
+        nodes = list(self._iter_nodes())
+        if key is None:
+            nodes.sort(key=_element_of, reverse=reverse)
+        else:
+            keys = {node: key(node._element) for node in nodes}
+            nodes.sort(key=keys.__getitem__, reverse=reverse)
+        self._relink(nodes)
+
+    def _relink(self, nodes):
+        """Utility method: link all the nodes of the list in between the sentinels in the order of a giving sequence"""
+        prev_node = self._head
+        for node in nodes:
+            node._prev = prev_node
+            prev_node._next = node
+            prev_node = node
+        prev_node._next = self._tail
+        self._tail._prev = prev_node
+        self._sorted()
+
+    def _sorted(self):
+        """Utility method: bookkeeping after the nodes were relinked in sorted order"""
+        self._mod_count += 1
+        self._finger = None
+        if self._index is not None:
+            self._index.rebuild()
+
+    def merge(self, *others, key=None):
+        """
+        Merge already sorted linked lists into the current sorted linked list in O(n log k) and destroy them
+
+        The nodes are relinked, not copied, following a heap over the k lists. The merge is stable:
+        equal elements keep the elements of the current list first, then those of others in the giving
+        order. Positions of the current list stay valid; positions obtained from others are no longer valid.
+
+        Param others: linked list objects sorted by key, left empty
+        Param key: optional one-argument function used to extract a comparison key from each element
+
+        Returns: None (nothing)
+        """
+        for L in others:
+            if not isinstance(L, LinkedList):
+                raise TypeError("can only merge LinkedLists")
+            if L is self:
+                raise ValueError("cannot merge a linked list into itself")
+        if len({id(L) for L in others}) != len(others):
+            raise ValueError("cannot merge the same linked list twice")
+        others = [L for L in others if L._size]
+        if not others:
+            return
+        if key is None:
+            node_key = _element_of
+        else:
+            def node_key(node):
+                return key(node._element)
+        order = list(heapq.merge(self._iter_nodes(), *[L._iter_nodes() for L in others], key=node_key))
+        if self._values is not None:
+            self._adopt_values(*others)
+
+        prev_node = self._head
+        for node in order:
+            node._prev = prev_node
+            prev_node._next = node
+            prev_node = node
+        prev_node._next = self._tail
+        self._tail._prev = prev_node
+        self._size = len(order)
+        for L in others:
+            L._forget_nodes()
+            L._epoch += 1
+        self._sorted()
+
+    def insort(self, value, key=None):
+        """
+        Insert a giving value into the sorted linked list after every element not greater than it, like bisect.insort
+
+        An indexed list binary searches the insertion point in O(log^2 n); otherwise the list is
+        walked from its end, which is fast when values mostly arrive in order.
+
+        Param value: the value to insert
+        Param key: optional one-argument function used to extract a comparison key from the value and each element
 
-                    self.delete(pivot)
-                    self.add_before(walk, pivot_value)
+        Returns: the position of the inserted value
+        """
+        k = value if key is None else key(value)
+        if self._index is not None:
+            select = self._index.select
+            lo = 0
+            hi = self._size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                el = select(mid)._element
+                if k < (el if key is None else key(el)):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            successor = select(lo) if lo < self._size else self._tail
+        else:
+            successor = self._tail
+            node = successor._prev
+            while node is not self._head and k < (node._element if key is None else key(node._element)):
+                successor = node
+                node = node._prev
+        return self._insert_between(value, successor._prev, successor)
@@ -1,7 +1,88 @@
 class Node:
     """Class for storing linked list node."""
-    
+    __slots__ = '_element', '_next', '_prev'
+
+    # nodes that are never reused keep generation 0 without storing it
+    _generation = 0
+
     def __init__(self, element, next_pointer, prev_pointer=None):
         self._element = element
         self._next = next_pointer
-        self._prev = prev_pointer
\ No newline at end of file
+        self._prev = prev_pointer
+
+
+class _PooledNode(Node):
+    """Node created by a NodePool, counting how many times it was released for reuse"""
+    __slots__ = '_generation',
+
+    def __init__(self, element, next_pointer, prev_pointer=None):
+        self._element = element
+        self._next = next_pointer
+        self._prev = prev_pointer
+        self._generation = 0
+
+class NodePool:
+    """
+    Bounded free list of nodes that can be shared by several linked lists, queues and stacks
+
+    Nodes released by dequeue, pop and delete are reused by the next insertion instead of
+    allocating a new node. Every release bumps the generation of the node, so a position of a
+    removed element is rejected as no longer valid even after its node was reused.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initiate an empty node pool
+
+        Param maxsize: maximum number of free nodes kept for reuse: default to 1024
+        """
+        self._free = []
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """
+        Return the number of free nodes in the pool
+
+        Returns: int
+        """
+        return len(self._free)
+
+    def acquire(self, element, next_pointer, prev_pointer=None):
+        """
+        Return a free node initialized with the giving fields, or a new node if the pool is empty
+
+        Returns: node
+        """
+        free = self._free
+        if free:
+            self.hits += 1
+            node = free.pop()
+            node._element = element
+            node._next = next_pointer
+            node._prev = prev_pointer
+            return node
+        self.misses += 1
+        return _PooledNode(element, next_pointer, prev_pointer)
+
+    def release(self, node):
+        """
+        Clear a node that was removed from its structure and keep it for reuse if the pool is not full
+
+        Only nodes created by a pool are kept, so that positions of the other nodes are never fooled by a reuse.
+
+        Returns: None (nothing)
+        """
+        node._element = node._next = node._prev = None
+        if type(node) is _PooledNode and len(self._free) < self._maxsize:
+            node._generation += 1
+            self._free.append(node)
+
+    def stats(self):
+        """
+        Return the pool counters
+
+        Returns: dict with the number of hits, misses and free nodes
+        """
+        return {"hits": self.hits, "misses": self.misses, "free": len(self._free)}
@@ -0,0 +1,429 @@
+import collections
+import functools
+import mmap
+import os
+import pickle
+import struct
+import zlib
+
+from .exceptions import Empty
+
+_RECORD = struct.Struct('<III')
+_MAGIC = 0x51545344
+_CURSOR = struct.Struct('<QQ')
+_CHECKSUM = struct.Struct('<I')
+_SUFFIX = '.seg'
+_HEAD_FILE = 'head'
+_FROM_HEAD_FILE = object()
+
+
+def _segment_path(directory, number):
+    """Utility function: path of the segment file with the giving number"""
+    return os.path.join(directory, '%020d%s' % (number, _SUFFIX))
+
+
+class _Segment:
+    """Append-only, memory-mapped segment file of a persistent queue"""
+    __slots__ = '_number', '_path', '_file', '_map'
+
+    def __init__(self, directory, number, size):
+        """
+        Open (or create with the giving size) the segment file with the giving number
+
+        Param directory: directory of the segment files
+        Param number: sequence number of the segment
+        Param size: minimum size of the file in bytes
+        """
+        self._number = number
+        self._path = _segment_path(directory, number)
+        self._file = open(self._path, 'r+b' if os.path.exists(self._path) else 'w+b')
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def read(self, offset):
+        """
+        Read the record at a giving offset
+
+        Returns: tuple (payload, offset of the next record), or None if there is no valid record at offset
+        """
+        m = self._map
+        start = offset + _RECORD.size
+        if start > len(m):
+            return None
+        magic, size, checksum = _RECORD.unpack_from(m, offset)
+        if magic != _MAGIC or start + size > len(m):
+            return None
+        payload = m[start:start + size]
+        if zlib.crc32(payload) != checksum:
+            return None
+        return payload, start + size
+
+    def fits(self, offset, size):
+        """Return True if a record with a payload of the giving size can be written at offset"""
+        return offset + _RECORD.size + size <= len(self._map)
+
+    def write(self, offset, payload):
+        """
+        Write a record at a giving offset, the payload first and the header last
+
+        Returns: offset of the next record
+        """
+        m = self._map
+        start = offset + _RECORD.size
+        m[start:start + len(payload)] = payload
+        _RECORD.pack_into(m, offset, _MAGIC, len(payload), zlib.crc32(payload))
+        return start + len(payload)
+
+    def clear_from(self, offset):
+        """Zero the bytes after the last valid record, left by an interrupted write"""
+        m = self._map
+        if any(m[offset:offset + _RECORD.size]):
+            m[offset:] = bytes(len(m) - offset)
+
+    def flush(self):
+        """Write the mapped pages back to the file"""
+        self._map.flush()
+
+    def close(self):
+        """Unmap and close the segment file"""
+        self._map.close()
+        self._file.close()
+
+
+class PersistentQueue:
+    """
+    Disk backed FIFO queue storing its elements in append-only, memory-mapped segment files
+
+    Elements are serialized (pickled by default) into checksummed records. A cursor file records
+    how far the queue was consumed; it is synced, together with the segment being written, every
+    fsync_every changes, on flush() and on close(), so after a crash the elements dequeued since
+    the last sync are delivered again. Segments are deleted once all their elements are consumed.
+
+    With a high_watermark, up to that many elements are kept in memory only and the queue spills
+    to disk past it; those elements survive close() but not a crash.
+    """
+
+    def __init__(self, directory, high_watermark=0, segment_size=1 << 22, fsync_every=64, cache_size=64,
+                 dumps=None, loads=None):
+        """
+        Open the queue stored in a giving directory, creating it if needed and recovering it after a crash
+
+        Param directory: directory holding the segment files, created if missing
+        Param high_watermark: number of elements kept in memory only before spilling to disk; 0 writes every element to disk: default to 0
+        Param segment_size: size of a segment file in bytes (larger for an element that does not fit): default to 4 MiB
+        Param fsync_every: number of enqueued or dequeued disk elements between two syncs, 0 only syncs on flush and close: default to 64
+        Param cache_size: number of elements read ahead from disk into memory at once: default to 64
+        Param dumps: function serializing an element to bytes: default to pickle.dumps
+        Param loads: function deserializing an element from bytes: default to pickle.loads
+        """
+        self._directory = directory
+        self._high_watermark = high_watermark
+        self._segment_size = segment_size
+        self._fsync_every = fsync_every
+        self._cache_size = max(cache_size, 1)
+        self._dumps = dumps or functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+        self._loads = loads or pickle.loads
+        self._head = collections.deque()
+        self._disk_count = 0
+        self._head_file_count = 0
+        self._retired = collections.deque()
+        self._pending = 0
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+        self._cursor_fd = os.open(os.path.join(directory, 'cursor'), os.O_RDWR | os.O_CREAT, 0o644)
+        self._recover()
+
+    def _segment_numbers(self):
+        """Utility method: sorted numbers of the segment files in the directory"""
+        numbers = []
+        for name in os.listdir(self._directory):
+            stem = name[:-len(_SUFFIX)]
+            if name.endswith(_SUFFIX) and stem.isdigit():
+                numbers.append(int(stem))
+        return sorted(numbers)
+
+    def _load_cursor(self):
+        """Utility method: (segment number, offset) of the first unconsumed record, (0, 0) if unknown"""
+        data = os.pread(self._cursor_fd, _CURSOR.size + _CHECKSUM.size, 0)
+        if len(data) < _CURSOR.size + _CHECKSUM.size:
+            return 0, 0
+        if _CHECKSUM.unpack_from(data, _CURSOR.size)[0] != zlib.crc32(data[:_CURSOR.size]):
+            return 0, 0
+        return _CURSOR.unpack_from(data)
+
+    @staticmethod
+    def _scan(segment, offset):
+        """Utility method: count the valid records of a segment from a giving offset"""
+        count = 0
+        while True:
+            record = segment.read(offset)
+            if record is None:
+                return count, offset
+            count += 1
+            offset = record[1]
+
+    def _recover(self):
+        """Utility method: reopen the segments, drop the consumed ones and count the unconsumed records"""
+        number, offset = self._load_cursor()
+        numbers = self._segment_numbers()
+        for n in numbers:
+            if n < number:
+                os.remove(_segment_path(self._directory, n))
+        numbers = [n for n in numbers if n >= number]
+        if not numbers or numbers[0] != number:
+            offset = 0
+        if not numbers:
+            numbers = [number]
+
+        self._reader = _Segment(self._directory, numbers[0], self._segment_size)
+        self._read_offset = offset
+        self._cursor = (numbers[0], offset)
+        segment = self._reader
+        for n in numbers:
+            if n != segment._number:
+                if segment is not self._reader:
+                    segment.close()
+                segment = _Segment(self._directory, n, 0)
+            count, end = self._scan(segment, offset if n == numbers[0] else 0)
+            self._disk_count += count
+        segment.clear_from(end)
+        self._writer = segment
+        self._write_offset = end
+        self._load_head_file()
+
+    def _load_head_file(self):
+        """Utility method: put back in memory the elements saved by close() ahead of the disk records"""
+        path = os.path.join(self._directory, _HEAD_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as file:
+            data = file.read()
+        offset = 0
+        while offset + _RECORD.size <= len(data):
+            magic, size, checksum = _RECORD.unpack_from(data, offset)
+            payload = data[offset + _RECORD.size:offset + _RECORD.size + size]
+            if magic != _MAGIC or len(payload) != size or zlib.crc32(payload) != checksum:
+                break
+            self._head.append((self._loads(payload), _FROM_HEAD_FILE))
+            offset += _RECORD.size + size
+        self._head_file_count = len(self._head)
+        if not self._head:
+            os.remove(path)
+
+    def _save_head_file(self):
+        """Utility method: atomically write the elements in memory to the head file"""
+        path = os.path.join(self._directory, _HEAD_FILE)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            for item, _ in self._head:
+                payload = self._dumps(item)
+                file.write(_RECORD.pack(_MAGIC, len(payload), zlib.crc32(payload)))
+                file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    def _changed(self):
+        """Utility method: count a change and sync once fsync_every changes were made"""
+        self._pending += 1
+        if self._fsync_every and self._pending >= self._fsync_every:
+            self.flush()
+
+    def _append(self, payload):
+        """Utility method: append a record to the segment being written, starting a new segment if it is full"""
+        writer = self._writer
+        if not writer.fits(self._write_offset, len(payload)):
+            writer.flush()
+            if writer is not self._reader:
+                writer.close()
+            size = max(self._segment_size, _RECORD.size + len(payload))
+            writer = self._writer = _Segment(self._directory, writer._number + 1, size)
+            self._write_offset = 0
+        self._write_offset = writer.write(self._write_offset, payload)
+        self._disk_count += 1
+        self._changed()
+
+    def _refill(self):
+        """Utility method: read up to cache_size records ahead from disk into memory"""
+        head = self._head
+        while self._disk_count and len(head) < self._cache_size:
+            record = self._reader.read(self._read_offset)
+            if record is None:
+                old = self._reader
+                number = old._number + 1
+                if self._writer._number == number:
+                    self._reader = self._writer
+                else:
+                    self._reader = _Segment(self._directory, number, 0)
+                self._read_offset = 0
+                old.close()
+                self._retired.append(old._number)
+                continue
+            payload, self._read_offset = record
+            head.append((self._loads(payload), (self._reader._number, self._read_offset)))
+            self._disk_count -= 1
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue
+
+        Returns: int: size of the queue
+        """
+        return len(self._head) + self._disk_count
+
+    def is_empty(self):
+        """
+        Return True if queue is empty
+
+        Returns: bool
+        """
+        return not self._head and not self._disk_count
+
+    def enqueue(self, el):
+        """
+        Add a giving element to the end of the queue, in memory below the high watermark and on disk past it
+
+        Param el: element to be added to the queue
+
+        Returns: None (nothing)
+        """
+        if not self._disk_count and len(self._head) < self._high_watermark:
+            self._head.append((el, None))
+            return
+        self._append(self._dumps(el))
+
+    def enqueue_many(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the queue
+
+        Param iterable: elements to be added to the queue
+
+        Returns: None (nothing)
+        """
+        for el in iterable:
+            self.enqueue(el)
+
+    def dequeue(self):
+        """
+        Remove an element from the front of the queue
+
+        Returns: the removed element
+        """
+        if not self._head:
+            self._refill()
+            if not self._head:
+                raise Empty("Queue is empty")
+        el, location = self._head.popleft()
+        if location is _FROM_HEAD_FILE:
+            self._head_file_count -= 1
+            if not self._head_file_count:
+                os.remove(os.path.join(self._directory, _HEAD_FILE))
+        elif location is not None:
+            self._cursor = location
+            retired = self._retired
+            while retired and retired[0] < location[0]:
+                os.remove(_segment_path(self._directory, retired.popleft()))
+            self._changed()
+        return el
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        return [self.dequeue() for _ in range(min(n, len(self)))]
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        if self.is_empty():
+            return default
+        return self.dequeue()
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        if self.is_empty():
+            return False, None
+        return True, self.dequeue()
+
+    def first(self):
+        """Returns the first element in the queue"""
+        if not self._head:
+            self._refill()
+            if not self._head:
+                raise Empty("Queue is empty")
+        return self._head[0][0]
+
+    def flush(self):
+        """
+        Sync the segment being written and the consumption cursor to disk
+
+        Returns: None (nothing)
+        """
+        self._writer.flush()
+        data = _CURSOR.pack(*self._cursor)
+        os.pwrite(self._cursor_fd, data + _CHECKSUM.pack(zlib.crc32(data)), 0)
+        os.fsync(self._cursor_fd)
+        self._pending = 0
+
+    def close(self):
+        """
+        Save the elements kept in memory, sync and close the queue
+
+        Returns: None (nothing)
+        """
+        if self._closed:
+            return
+        if any(location is None or location is _FROM_HEAD_FILE for _, location in self._head):
+            self._save_head_file()
+            self._cursor = (self._reader._number, self._read_offset)
+        self.flush()
+        if self._reader is not self._writer:
+            self._reader.close()
+        self._writer.close()
+        os.close(self._cursor_fd)
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over the elements kept in memory, then the elements on disk
+
+        Returns: None (nothing)
+        """
+        for item, _ in list(self._head):
+            yield item
+        segment = self._reader
+        offset = self._read_offset
+        for _ in range(self._disk_count):
+            record = segment.read(offset)
+            while record is None:
+                number = segment._number + 1
+                if segment is not self._reader and segment is not self._writer:
+                    segment.close()
+                segment = self._writer if self._writer._number == number else _Segment(self._directory, number, 0)
+                offset = 0
+                record = segment.read(offset)
+            payload, offset = record
+            yield self._loads(payload)
+        if segment is not self._reader and segment is not self._writer:
+            segment.close()
@@ -0,0 +1,212 @@
+from .utils import _Position
+from .exceptions import Empty
+from .exceptions import ValueError
+
+
+class _HeapItem:
+    """Entry of a priority queue: element, sort key (priority, insertion order) and current slot in the heap array"""
+    __slots__ = '_element', '_key', '_index'
+
+    def __init__(self, element, key, index):
+        self._element = element
+        self._key = key
+        self._index = index
+
+
+class PriorityQueue:
+    """
+    Position based min priority queue implementation using an indexed binary heap
+
+    Every item knows its slot in the heap array, so a position can be used to
+    change the priority of, or remove, an item in O(log n). Items of equal
+    priority are removed in insertion order.
+    """
+
+    class Position(_Position):
+        """extension of the inherited _Position class for positioning of heap items"""
+        __slots__ = ()
+
+        def priority(self):
+            """Return the priority of the item at this Position."""
+            return self._node._key[0]
+
+    def __init__(self):
+        """Initiate an empty priority queue"""
+        self._heap = []
+        self._order = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the priority queue
+
+        Returns: int: size of the priority queue
+        """
+        return len(self._heap)
+
+    def is_empty(self):
+        """
+        Return True if priority queue is empty
+
+        Returns: bool
+        """
+        return not self._heap
+
+    def _validate(self, p):
+        """Return position's item if position is valid, else raise inappropriate error."""
+        if not isinstance(p, self.Position):
+            raise TypeError("improper Position")
+        if p._container is not self:
+            raise ValueError("position does not belong to this container")
+        if p._node._index is None:
+            raise ValueError("position is no longer valid")
+        return p._node
+
+    def _sift_up(self, i):
+        """Utility method: move the item at slot i up until its parent is not greater"""
+        heap = self._heap
+        item = heap[i]
+        key = item._key
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_item = heap[parent]
+            if not key < parent_item._key:
+                break
+            heap[i] = parent_item
+            parent_item._index = i
+            i = parent
+        heap[i] = item
+        item._index = i
+
+    def _sift_down(self, i):
+        """Utility method: move the item at slot i down until no child is smaller"""
+        heap = self._heap
+        size = len(heap)
+        item = heap[i]
+        key = item._key
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            child_item = heap[child]
+            right = child + 1
+            if right < size and heap[right]._key < child_item._key:
+                child = right
+                child_item = heap[child]
+            if not child_item._key < key:
+                break
+            heap[i] = child_item
+            child_item._index = i
+            i = child
+        heap[i] = item
+        item._index = i
+
+    def push(self, el, priority):
+        """
+        Add a giving element with a giving priority to the priority queue in O(log n)
+
+        Param el: element to be added to the priority queue
+        Param priority: priority of the element, smaller priorities are removed first
+
+        Returns: position object
+        """
+        heap = self._heap
+        item = _HeapItem(el, (priority, self._order), len(heap))
+        self._order += 1
+        heap.append(item)
+        self._sift_up(item._index)
+        return self.Position(self, item)
+
+    def first(self):
+        """
+        Returns the element with the smallest priority, without removing it
+
+        Returns: tuple (priority, element)
+        """
+        if not self._heap:
+            raise Empty("Priority queue is empty")
+        item = self._heap[0]
+        return item._key[0], item._element
+
+    def first_position(self):
+        """Returns the position of the element with the smallest priority, or None if the priority queue is empty"""
+        if not self._heap:
+            return None
+        return self.Position(self, self._heap[0])
+
+    def _remove_at(self, i):
+        """Utility method: remove the item at slot i of the heap and restore the heap order"""
+        heap = self._heap
+        item = heap[i]
+        last = heap.pop()
+        if last is not item:
+            heap[i] = last
+            last._index = i
+            if i > 0 and last._key < heap[(i - 1) >> 1]._key:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        item._index = None
+        return item
+
+    def pop(self):
+        """
+        Remove the element with the smallest priority in O(log n)
+
+        Returns: tuple (priority, element)
+        """
+        if not self._heap:
+            raise Empty("Priority queue is empty")
+        item = self._remove_at(0)
+        return item._key[0], item._element
+
+    def decrease_key(self, p, priority):
+        """
+        Lower the priority of the element at a giving position in O(log n)
+
+        Param p: the position of the element
+        Param priority: the new priority, not greater than the current one
+
+        Returns: None (nothing)
+        """
+        item = self._validate(p)
+        if item._key[0] < priority:
+            raise ValueError("new priority is greater than the current priority")
+        item._key = (priority, item._key[1])
+        self._sift_up(item._index)
+
+    def update(self, p, priority):
+        """
+        Change the priority of the element at a giving position, up or down, in O(log n)
+
+        Param p: the position of the element
+        Param priority: the new priority
+
+        Returns: None (nothing)
+        """
+        item = self._validate(p)
+        item._key = (priority, item._key[1])
+        i = item._index
+        if i > 0 and item._key < self._heap[(i - 1) >> 1]._key:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, p):
+        """
+        Remove the element at a giving position in O(log n)
+
+        Param p: the position of the element to be removed
+
+        Returns: tuple (priority, element)
+        """
+        item = self._remove_at(self._validate(p)._index)
+        return item._key[0], item._element
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over the elements in heap order (not sorted)
+
+        Returns: None (nothing)
+        """
+        for item in list(self._heap):
+            yield item._element
@@ -1,5 +1,5 @@
 from .node import Node
-from .utils import _Position
+from .utils import _NodePosition
 from .exceptions import Empty
 from .exceptions import ValueError
 
@@ -7,10 +7,15 @@ from .exceptions import ValueError
 class QueueBase:
     """A base class providing a circularly linked list based queue representation"""
 
-    def __init__(self):
-        """Initiate an empty queue with a null tail node"""
+    def __init__(self, pool=None):
+        """
+        Initiate an empty queue with a null tail node
+
+        Param pool: optional NodePool that dequeued nodes are returned to and new nodes are taken from: default to None
+        """
         self._tail = None
         self._size = 0
+        self._pool = pool
         
     def __len__(self):
         """
@@ -37,7 +42,8 @@ class QueueBase:
 
         Returns: None (nothing) if called is False but return the newly added node if called is set to True
         """
-        new_tail_node = Node(el, None)
+        pool = self._pool
+        new_tail_node = Node(el, None) if pool is None else pool.acquire(el, None)
         if self.is_empty():
             new_tail_node._next = new_tail_node
         else:
@@ -63,7 +69,110 @@ class QueueBase:
         else:
             self._tail._next = head._next
         self._size -= 1
-        return head._element
+        el = head._element
+        if self._pool is not None:
+            self._pool.release(head)
+        return el
+
+    def enqueue_many(self, iterable):
+        """
+        Add all the elements of a giving iterable to the end of the queue
+
+        The new nodes are chained in one pass, detached from the queue, and the chain is linked
+        after the tail once the iterable is exhausted, so an iterable that raises leaves the
+        queue unchanged.
+
+        Param iterable: elements to be added to the queue
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        pool = self._pool
+        first_node = last_node = None
+        count = 0
+        for el in iterable:
+            node = Node(el, None) if pool is None else pool.acquire(el, None)
+            if last_node is None:
+                first_node = node
+            else:
+                last_node._next = node
+            last_node = node
+            count += 1
+        if count:
+            tail = self._tail
+            if tail is None:
+                last_node._next = first_node
+            else:
+                last_node._next = tail._next
+                tail._next = first_node
+            self._tail = last_node
+            self._size += count
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue
+
+        The removed nodes are detached as one chain and the size is updated once.
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, in queue order
+        """
+        count = min(n, self._size)
+        if count <= 0:
+            return []
+        pool = self._pool
+        items = []
+        node = self._tail._next
+        for _ in range(count):
+            next_node = node._next
+            items.append(node._element)
+            if pool is not None:
+                pool.release(node)
+            node = next_node
+        if count == self._size:
+            self._tail = None
+        else:
+            self._tail._next = node
+        self._size -= count
+        return items
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a queue holding the elements of a giving iterable, first element at the front
+
+        Param iterable: elements of the new queue
+        Param kwargs: keyword arguments of the constructor
+
+        Returns: the new queue
+        """
+        Q = cls(**kwargs)
+        Q.enqueue_many(iterable)
+        return Q
+
+    def dequeue_or(self, default=None):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Param default: value returned when the queue is empty: default to None
+
+        Returns: the removed element, or default if the queue is empty
+        """
+        if self._size == 0:
+            return default
+        return QueueBase.dequeue(self)
+
+    def try_dequeue(self):
+        """
+        Remove an element from the front of the queue without raising when the queue is empty
+
+        Returns: tuple (True, removed element), or (False, None) if the queue is empty
+        """
+        if self._size == 0:
+            return False, None
+        return True, QueueBase.dequeue(self)
 
     def first(self):
         """Returns the first element in the queue"""
@@ -89,14 +198,24 @@ class QueueBase:
 
         Param Q: A queue object to join with the current queue
 
+        The circular lists are joined in O(1) by swapping the links between the two tails.
+
         Returns: None
         """
+        if Q is self:
+            raise ValueError("cannot join a queue with itself")
         if Q.is_empty():
             return
-        for _ in Q:
-            self.enqueue(Q.dequeue())
-            if Q.is_empty():
-                break
+        if self.is_empty():
+            self._tail = Q._tail
+        else:
+            first_node = self._tail._next
+            self._tail._next = Q._tail._next
+            Q._tail._next = first_node
+            self._tail = Q._tail
+        self._size += Q._size
+        Q._tail = None
+        Q._size = 0
 
     def concat(self, Q):
         """
@@ -129,9 +248,9 @@ class QueueBase:
 class Queue(QueueBase):
     """Position based queue implementation using a queue base class"""
 
-    class Position(_Position):
-        """extension of the inherited _Position class for positioning of nodes"""
-        pass
+    class Position(_NodePosition):
+        """extension of the inherited _NodePosition class for positioning of nodes"""
+        __slots__ = ()
 
     def _get_position(self, node):
         """
@@ -147,7 +266,7 @@ class Queue(QueueBase):
             raise TypeError("improper Position")
         if p._container is not self:
             raise ValueError("position does not belong to this container")
-        if p._node._next == None:
+        if p._node._next == None or p._generation != p._node._generation:
             raise ValueError("position is no longer valid")
         return p._node
 
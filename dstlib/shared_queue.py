@@ -0,0 +1,293 @@
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+from .exceptions import Empty, Full
+from .exceptions import ValueError
+
+_HEADER = struct.Struct('<QQ')
+_WAITERS = struct.Struct('<II')
+_DATA = _HEADER.size + _WAITERS.size
+_LENGTH = struct.Struct('<I')
+
+
+class SharedQueue:
+    """
+    Multiprocess FIFO queue of byte records stored in a ring of fixed-size slots in shared memory
+
+    The shared memory block starts with two counters (dequeued and enqueued records) and the
+    number of processes waiting to get and to put, followed by the slots; every slot holds a 4 byte
+    length prefix and the payload. Records are copied in and out of the block directly, without
+    pickling, under a cross-process lock. Pass the queue to child processes as a
+    multiprocessing.Process argument; it is pickled as a reference to the same block and lock.
+    """
+
+    def __init__(self, slots=1024, slot_size=256, ctx=None):
+        """
+        Initiate an empty queue in a new shared memory block
+
+        Param slots: maximum number of queued records: default to 1024
+        Param slot_size: size of a slot in bytes, records can hold slot_size - 4 bytes: default to 256
+        Param ctx: optional multiprocessing context used to create the lock: default to the default context
+        """
+        if slots < 1 or slot_size <= _LENGTH.size:
+            raise ValueError("a shared queue needs at least one slot larger than %d bytes" % _LENGTH.size)
+        ctx = ctx or multiprocessing.get_context()
+        self._slots = slots
+        self._slot_size = slot_size
+        self._shm = shared_memory.SharedMemory(create=True, size=_DATA + slots * slot_size)
+        _HEADER.pack_into(self._shm.buf, 0, 0, 0)
+        _WAITERS.pack_into(self._shm.buf, _HEADER.size, 0, 0)
+        self._lock = ctx.Lock()
+        self._not_empty = ctx.Condition(self._lock)
+        self._not_full = ctx.Condition(self._lock)
+        self._owner = True
+
+    def __getstate__(self):
+        """Pickle the queue as the name of its shared memory block and its synchronization primitives"""
+        return (self._shm.name, self._slots, self._slot_size, self._lock, self._not_empty, self._not_full)
+
+    def __setstate__(self, state):
+        """Attach to the shared memory block of a queue created in another process"""
+        name, self._slots, self._slot_size, self._lock, self._not_empty, self._not_full = state
+        self._shm = shared_memory.SharedMemory(name=name)
+        self._owner = False
+
+    @property
+    def max_record_size(self):
+        """Largest record, in bytes, that fits in a slot"""
+        return self._slot_size - _LENGTH.size
+
+    def _counters(self):
+        """Utility method: (dequeued, enqueued) record counters; the lock must be held"""
+        return _HEADER.unpack_from(self._shm.buf, 0)
+
+    def _slot_offset(self, counter):
+        """Utility method: offset in the block of the slot used by the record with the giving counter"""
+        return _DATA + (counter % self._slots) * self._slot_size
+
+    def __len__(self):
+        """
+        Return the number of records in the queue
+
+        Returns: int: size of the queue
+        """
+        with self._lock:
+            head, tail = self._counters()
+        return tail - head
+
+    def is_empty(self):
+        """
+        Return True if queue is empty
+
+        Returns: bool
+        """
+        return len(self) == 0
+
+    def _write(self, data):
+        """Utility method: copy a record into the next free slot; the lock must be held and a slot must be free"""
+        head, tail = self._counters()
+        buf = self._shm.buf
+        offset = self._slot_offset(tail)
+        size = len(data)
+        _LENGTH.pack_into(buf, offset, size)
+        buf[offset + _LENGTH.size:offset + _LENGTH.size + size] = data
+        _HEADER.pack_into(buf, 0, head, tail + 1)
+        if _WAITERS.unpack_from(buf, _HEADER.size)[0]:
+            self._not_empty.notify()
+
+    def _view(self, counter):
+        """Utility method: memoryview of the payload of the record with the giving counter"""
+        buf = self._shm.buf
+        offset = self._slot_offset(counter) + _LENGTH.size
+        size = _LENGTH.unpack_from(buf, offset - _LENGTH.size)[0]
+        return buf[offset:offset + size]
+
+    def _read(self):
+        """Utility method: remove the first record and return its payload as bytes; the lock must be held"""
+        head, tail = self._counters()
+        with self._view(head) as view:
+            data = bytes(view)
+        self._consumed(head, tail)
+        return data
+
+    def _consumed(self, head, tail):
+        """Utility method: free the slot of the first record; the lock must be held"""
+        buf = self._shm.buf
+        _HEADER.pack_into(buf, 0, head + 1, tail)
+        if _WAITERS.unpack_from(buf, _HEADER.size)[1]:
+            self._not_full.notify()
+
+    def _checked(self, data):
+        """Utility method: return data as a byte buffer after checking that it fits in a slot"""
+        view = memoryview(data).cast('B')
+        if view.nbytes > self._slot_size - _LENGTH.size:
+            raise ValueError("record of %d bytes does not fit in a slot" % view.nbytes)
+        return view
+
+    def enqueue(self, data):
+        """
+        Add a giving record to the end of the queue without waiting
+
+        Param data: bytes-like object of at most max_record_size bytes
+
+        Returns: None (nothing); raises Full if every slot is used
+        """
+        view = self._checked(data)
+        with self._lock:
+            head, tail = self._counters()
+            if tail - head == self._slots:
+                raise Full("Queue is full")
+            self._write(view)
+
+    def dequeue(self):
+        """
+        Remove a record from the front of the queue without waiting
+
+        Returns: the removed record as bytes; raises Empty if the queue is empty
+        """
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                raise Empty("Queue is empty")
+            return self._read()
+
+    def dequeue_into(self, buffer):
+        """
+        Remove a record from the front of the queue, copying it into a giving writable buffer without allocating
+
+        Param buffer: writable bytes-like object of at least max_record_size bytes, or of the record's size
+
+        Returns: int: the size of the record; raises Empty if the queue is empty
+        """
+        target = memoryview(buffer).cast('B')
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                raise Empty("Queue is empty")
+            with self._view(head) as view:
+                size = view.nbytes
+                if size > target.nbytes:
+                    raise ValueError("buffer is smaller than the record")
+                target[:size] = view
+            self._consumed(head, tail)
+            return size
+
+    def _deadline_wait(self, condition, ready, timeout, lane):
+        """
+        Utility method: wait on condition (lock held) until ready() is True
+
+        The waiter is counted in the given lane of the header (0 for getters, 1 for putters) so
+        that records are only signalled when some process is waiting.
+
+        Returns: bool: False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not ready():
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+            self._add_waiter(lane, 1)
+            try:
+                condition.wait(remaining)
+            finally:
+                self._add_waiter(lane, -1)
+        return True
+
+    def _add_waiter(self, lane, delta):
+        """Utility method: change the number of waiting processes of a lane; the lock must be held"""
+        buf = self._shm.buf
+        waiters = list(_WAITERS.unpack_from(buf, _HEADER.size))
+        waiters[lane] += delta
+        _WAITERS.pack_into(buf, _HEADER.size, *waiters)
+
+    def put(self, data, timeout=None):
+        """
+        Add a giving record to the end of the queue, waiting for a free slot if the queue is full
+
+        Param data: bytes-like object of at most max_record_size bytes
+        Param timeout: maximum number of seconds to wait, None waits forever: default to None
+
+        Returns: None (nothing); raises Full on timeout
+        """
+        view = self._checked(data)
+        with self._lock:
+            if not self._deadline_wait(self._not_full, self._has_space, timeout, 1):
+                raise Full("Queue is full")
+            self._write(view)
+
+    def get(self, timeout=None):
+        """
+        Remove a record from the front of the queue, waiting for one if the queue is empty
+
+        Param timeout: maximum number of seconds to wait, None waits forever: default to None
+
+        Returns: the removed record as bytes; raises Empty on timeout
+        """
+        with self._lock:
+            if not self._deadline_wait(self._not_empty, self._has_items, timeout, 0):
+                raise Empty("Queue is empty")
+            return self._read()
+
+    def _has_items(self):
+        """Utility method: True if a record can be taken; the lock must be held"""
+        head, tail = self._counters()
+        return tail > head
+
+    def _has_space(self):
+        """Utility method: True if a record can be added; the lock must be held"""
+        head, tail = self._counters()
+        return tail - head < self._slots
+
+    def first(self):
+        """Returns the first record in the queue as bytes"""
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                raise Empty("Queue is empty")
+            with self._view(head) as view:
+                return bytes(view)
+
+    def first_view(self):
+        """
+        Returns a zero-copy memoryview of the first record in the shared memory block
+
+        The view stays valid until the record is dequeued, so it is only safe in the single consumer
+        that dequeues it; release it (or use it in a with statement) before closing the queue.
+
+        Returns: memoryview
+        """
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                raise Empty("Queue is empty")
+            return self._view(head)
+
+    def close(self):
+        """
+        Detach the current process from the shared memory block
+
+        Returns: None (nothing)
+        """
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory block; call once, from the creating process, after every process closed it
+
+        Returns: None (nothing)
+        """
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the queue, and destroy the block in the creating process"""
+        self.close()
+        if self._owner:
+            self.unlink()
@@ -0,0 +1,202 @@
+import random
+
+
+class _Tower:
+    """Express lanes of a node in the skip index (level k of the tower is skip level k + 1)"""
+    __slots__ = '_next', '_prev', '_width'
+
+    def __init__(self):
+        self._next = []
+        self._prev = []
+        self._width = []
+
+
+class _SkipIndex:
+    """
+    Indexable skip list over the nodes of a doubly linked list
+
+    The linked list itself is level 0 of the skip list. Nodes with a random
+    height h > 0 get a tower of h express lanes; every lane stores the number
+    of level 0 steps (width) to the next tower on the same lane, the tail
+    sentinel counting as the end of every lane. This gives expected O(log n)
+    lookup by index, index of a node, insertion and deletion.
+    """
+
+    MAX_HEIGHT = 32
+
+    def __init__(self, container):
+        """
+        Initiate the index of a linked list and build it from the current nodes
+
+        Param container: the linked list (a _DoubleLinkedBase) to index
+        """
+        self._container = container
+        self._random = random.Random()
+        self.rebuild()
+
+    def _random_height(self):
+        """Utility method: geometric height, P(height >= k) = 1/2**k"""
+        bits = self._random.getrandbits(self.MAX_HEIGHT)
+        return (bits ^ (bits + 1)).bit_length() - 1
+
+    def rebuild(self):
+        """
+        Rebuild the index from scratch in O(n), after the nodes were relinked in bulk
+
+        Returns: None (nothing)
+        """
+        container = self._container
+        head = container._head
+        head_tower = _Tower()
+        towers = {head: head_tower}
+        last = []
+        rank = 0
+        node = head._next
+        while node is not container._tail:
+            height = self._random_height()
+            if height:
+                tower = _Tower()
+                towers[node] = tower
+                while len(last) < height:
+                    head_tower._next.append(None)
+                    head_tower._prev.append(None)
+                    head_tower._width.append(0)
+                    last.append((head, -1))
+                for k in range(height):
+                    prev_node, prev_rank = last[k]
+                    prev_tower = towers[prev_node]
+                    prev_tower._next[k] = node
+                    prev_tower._width[k] = rank - prev_rank
+                    tower._next.append(None)
+                    tower._prev.append(prev_node)
+                    tower._width.append(0)
+                    last[k] = (node, rank)
+            rank += 1
+            node = node._next
+
+        for k, (prev_node, prev_rank) in enumerate(last):
+            towers[prev_node]._width[k] = rank - prev_rank
+        self._towers = towers
+
+    def _predecessors(self, node):
+        """
+        Utility method: find, for every lane, the last tower before node and its distance to node
+
+        Returns: tuple (predecessor nodes, distances) indexed by lane
+        """
+        towers = self._towers
+        head_height = len(towers[self._container._head]._next)
+        preds = []
+        dists = []
+        current = node._prev
+        distance = 1
+        while current not in towers:
+            current = current._prev
+            distance += 1
+        while True:
+            tower = towers[current]
+            height = len(tower._next)
+            while len(preds) < height:
+                preds.append(current)
+                dists.append(distance)
+            if len(preds) >= head_height:
+                return preds, dists
+            top = height - 1
+            current = tower._prev[top]
+            distance += towers[current]._width[top]
+
+    def insert(self, node):
+        """
+        Index a node that was just linked into the list (the list size already counts it)
+
+        Returns: None (nothing)
+        """
+        towers = self._towers
+        height = self._random_height()
+        head_tower = towers[self._container._head]
+        while len(head_tower._next) < height:
+            head_tower._next.append(None)
+            head_tower._prev.append(None)
+            head_tower._width.append(self._container._size)
+
+        preds, dists = self._predecessors(node)
+        tower = _Tower()
+        for k, pred in enumerate(preds):
+            pred_tower = towers[pred]
+            if k < height:
+                next_node = pred_tower._next[k]
+                tower._next.append(next_node)
+                tower._prev.append(pred)
+                tower._width.append(pred_tower._width[k] - dists[k] + 1)
+                pred_tower._next[k] = node
+                pred_tower._width[k] = dists[k]
+                if next_node is not None:
+                    towers[next_node]._prev[k] = node
+            else:
+                pred_tower._width[k] += 1
+        if height:
+            towers[node] = tower
+
+    def remove(self, node):
+        """
+        Drop a node from the index; must be called while the node is still linked
+
+        Returns: None (nothing)
+        """
+        towers = self._towers
+        preds, _ = self._predecessors(node)
+        tower = towers.pop(node, None)
+        height = len(tower._next) if tower is not None else 0
+        for k, pred in enumerate(preds):
+            pred_tower = towers[pred]
+            if k < height:
+                next_node = tower._next[k]
+                pred_tower._next[k] = next_node
+                pred_tower._width[k] += tower._width[k] - 1
+                if next_node is not None:
+                    towers[next_node]._prev[k] = pred
+            else:
+                pred_tower._width[k] -= 1
+
+    def rank(self, node):
+        """
+        Return the index of a node in the list
+
+        Returns: int
+        """
+        towers = self._towers
+        head = self._container._head
+        distance = 0
+        current = node
+        while current not in towers:
+            current = current._prev
+            distance += 1
+        while current is not head:
+            tower = towers[current]
+            top = len(tower._next) - 1
+            current = tower._prev[top]
+            distance += towers[current]._width[top]
+        return distance - 1
+
+    def select(self, i):
+        """
+        Return the node at index i, 0 <= i < len(list)
+
+        Returns: the node
+        """
+        towers = self._towers
+        current = self._container._head
+        tower = towers[current]
+        rank = -1
+        for k in range(len(tower._next) - 1, -1, -1):
+            while True:
+                next_node = tower._next[k]
+                if next_node is None or rank + tower._width[k] > i:
+                    break
+                rank += tower._width[k]
+                current = next_node
+                tower = towers[current]
+        while rank < i:
+            current = current._next
+            rank += 1
+        return current
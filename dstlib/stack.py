@@ -1,14 +1,20 @@
 from .node import Node
-from .utils import _Position
+from .utils import _NodePosition
 from .exceptions import Empty
+from .exceptions import ValueError
 
 class StackBase:
     """A base class providing a Stack implementation using a singly linked list."""
 
-    def __init__(self):
-        """Initiate an empty queue with a null head node"""
+    def __init__(self, pool=None):
+        """
+        Initiate an empty stack with a null head node
+
+        Param pool: optional NodePool that popped nodes are returned to and new nodes are taken from: default to None
+        """
         self._head = None
         self._size = 0
+        self._pool = pool
 
     def __len__(self):
         """
@@ -35,7 +41,8 @@ class StackBase:
 
         Returns: None (nothing) if called is False but return the newly added node if called is set to True
         """
-        self._head = Node(el, self._head)
+        pool = self._pool
+        self._head = Node(el, self._head) if pool is None else pool.acquire(el, self._head)
         self._size += 1
         if called:
             return self._head
@@ -51,7 +58,93 @@ class StackBase:
         head = self._head
         self._head = head._next
         self._size -= 1
-        return head._element
+        el = head._element
+        if self._pool is not None:
+            self._pool.release(head)
+        return el
+
+    def push_many(self, iterable):
+        """
+        Push all the elements of a giving iterable, the last one ending at the top of the stack
+
+        The new nodes are chained in one pass and the size is updated once.
+
+        Param iterable: elements to be added to the stack
+
+        Returns: None (nothing)
+        """
+        if iterable is self:
+            iterable = list(iterable)
+        pool = self._pool
+        head = self._head
+        count = 0
+        for el in iterable:
+            head = Node(el, head) if pool is None else pool.acquire(el, head)
+            count += 1
+        self._head = head
+        self._size += count
+
+    def pop_many(self, n):
+        """
+        Remove up to n elements from the top of the stack
+
+        The removed nodes are detached as one chain and the size is updated once.
+
+        Param n: maximum number of elements to remove
+
+        Returns: list of the removed elements, top element first
+        """
+        count = min(n, self._size)
+        if count <= 0:
+            return []
+        pool = self._pool
+        items = []
+        node = self._head
+        for _ in range(count):
+            next_node = node._next
+            items.append(node._element)
+            if pool is not None:
+                pool.release(node)
+            node = next_node
+        self._head = node
+        self._size -= count
+        return items
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a stack by pushing the elements of a giving iterable, the last one ending at the top
+
+        Param iterable: elements of the new stack
+        Param kwargs: keyword arguments of the constructor
+
+        Returns: the new stack
+        """
+        S = cls(**kwargs)
+        S.push_many(iterable)
+        return S
+
+    def pop_or(self, default=None):
+        """
+        Remove an element from the top of the stack without raising when the stack is empty
+
+        Param default: value returned when the stack is empty: default to None
+
+        Returns: the removed element, or default if the stack is empty
+        """
+        if self._size == 0:
+            return default
+        return StackBase.pop(self)
+
+    def try_pop(self):
+        """
+        Remove an element from the top of the stack without raising when the stack is empty
+
+        Returns: tuple (True, removed element), or (False, None) if the stack is empty
+        """
+        if self._size == 0:
+            return False, None
+        return True, StackBase.pop(self)
 
     def top(self):
         """
@@ -82,9 +175,9 @@ class StackBase:
 class Stack(StackBase):
     """Position based stack implementation using a stack base class"""
 
-    class Position(_Position):
-        """extension of the inherited _Position class for positioning of nodes"""
-        pass
+    class Position(_NodePosition):
+        """extension of the inherited _NodePosition class for positioning of nodes"""
+        __slots__ = ()
 
     def _get_position(self, node):
         """
@@ -100,7 +193,7 @@ class Stack(StackBase):
             raise TypeError("improper Position")
         if p._container is not self:
             raise ValueError("position does not belong to this container")
-        if p._node._next == None:
+        if p._node._next == None or p._generation != p._node._generation:
             raise ValueError("position is no longer valid")
         return p._node
 
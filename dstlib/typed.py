@@ -0,0 +1,418 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .exceptions import Empty
+
+
+def _require_numpy():
+    """Utility function: raise ImportError if NumPy is not installed"""
+    if np is None:
+        raise ImportError("TypedStack and TypedQueue require NumPy: pip install dstlib[numpy]")
+
+
+class TypedStack:
+    """
+    Stack of numbers of one NumPy dtype stored unboxed in a growable array
+
+    The array doubles when full and halves when less than a quarter full. Bulk
+    operations, the view of the contents and the reductions run at array speed.
+    """
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, dtype=float, capacity=DEFAULT_CAPACITY):
+        """
+        Initiate an empty typed stack
+
+        Param dtype: NumPy dtype of the elements, e.g. numpy.float64 or numpy.int64: default to float
+        Param capacity: initial number of slots of the underlying array: default to 16
+        """
+        _require_numpy()
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    @property
+    def dtype(self):
+        """NumPy dtype of the elements"""
+        return self._data.dtype
+
+    def __len__(self):
+        """
+        Return the number of elements in the stack
+
+        Returns: int: size of the stack
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if stack is empty
+
+        Returns: bool
+        """
+        return self._size == 0
+
+    def _resize(self, capacity):
+        """Utility method: move the elements into a new array of the giving capacity"""
+        data = np.empty(capacity, dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def push(self, el):
+        """
+        Add a giving element to the top of the stack, doubling the array when it is full
+
+        Param el: number to be added, converted to the dtype of the stack
+
+        Returns: None (nothing)
+        """
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))
+        self._data[self._size] = el
+        self._size += 1
+
+    def pop(self):
+        """
+        Remove the element at the top of the stack, halving the array when it is less than a quarter full
+
+        Returns: the removed element as a NumPy scalar
+        """
+        if self._size == 0:
+            raise Empty("Stack is empty")
+        self._size -= 1
+        el = self._data[self._size]
+        self._shrink()
+        return el
+
+    def _shrink(self):
+        """Utility method: halve the array while it is less than a quarter full"""
+        capacity = len(self._data)
+        while capacity > self.DEFAULT_CAPACITY and self._size < capacity // 4:
+            capacity //= 2
+        if capacity != len(self._data):
+            self._resize(capacity)
+
+    def push_many(self, values):
+        """
+        Push all the giving values with one vectorized copy, the last one ending at the top
+
+        Param values: array or iterable of numbers, converted to the dtype of the stack
+
+        Returns: None (nothing)
+        """
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        needed = self._size + len(values)
+        capacity = len(self._data)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        self._data[self._size:needed] = values
+        self._size = needed
+
+    def pop_many(self, n):
+        """
+        Remove up to n elements from the top of the stack with one vectorized copy
+
+        Param n: maximum number of elements to remove
+
+        Returns: ndarray of the removed elements, top element first
+        """
+        count = max(min(n, self._size), 0)
+        start = self._size - count
+        items = self._data[start:self._size][::-1].copy()
+        self._size = start
+        self._shrink()
+        return items
+
+    @classmethod
+    def from_iterable(cls, values, **kwargs):
+        """
+        Build a stack by pushing the giving values, the last one ending at the top
+
+        Param values: array or iterable of numbers
+        Param kwargs: keyword arguments of the constructor (dtype, capacity)
+
+        Returns: the new stack
+        """
+        S = cls(**kwargs)
+        S.push_many(values)
+        return S
+
+    def top(self):
+        """
+        Returns the element at the top of the stack
+
+        Returns: the top element as a NumPy scalar
+        """
+        if self._size == 0:
+            raise Empty("Stack is empty")
+        return self._data[self._size - 1]
+
+    def view(self):
+        """
+        Returns a zero-copy, read-only view of the elements, from the bottom to the top of the stack
+
+        The view reflects later changes of existing slots but not pushes; it must not be used
+        after the array was resized.
+
+        Returns: ndarray
+        """
+        view = self._data[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def sum(self):
+        """Returns the sum of the elements (0 for an empty stack)"""
+        return self._data[:self._size].sum()
+
+    def mean(self):
+        """Returns the mean of the elements"""
+        if self._size == 0:
+            raise Empty("Stack is empty")
+        return self._data[:self._size].mean()
+
+    def min(self):
+        """Returns the smallest element"""
+        if self._size == 0:
+            raise Empty("Stack is empty")
+        return self._data[:self._size].min()
+
+    def max(self):
+        """Returns the largest element"""
+        if self._size == 0:
+            raise Empty("Stack is empty")
+        return self._data[:self._size].max()
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over a snapshot of the stack, from the top
+
+        Returns: None (nothing)
+        """
+        return iter(self._data[:self._size][::-1].tolist())
+
+
+class TypedQueue:
+    """
+    Queue of numbers of one NumPy dtype stored unboxed in a circular array (ring buffer)
+
+    The array doubles when full and halves when less than a quarter full. Bulk
+    operations copy at most two slices, and the reductions run over them in place.
+    """
+
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, dtype=float, capacity=DEFAULT_CAPACITY):
+        """
+        Initiate an empty typed queue
+
+        Param dtype: NumPy dtype of the elements, e.g. numpy.float64 or numpy.int64: default to float
+        Param capacity: initial number of slots of the underlying array: default to 16
+        """
+        _require_numpy()
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._front = 0
+        self._size = 0
+
+    @property
+    def dtype(self):
+        """NumPy dtype of the elements"""
+        return self._data.dtype
+
+    def __len__(self):
+        """
+        Return the number of elements in the queue
+
+        Returns: int: size of the queue
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if queue is empty
+
+        Returns: bool
+        """
+        return self._size == 0
+
+    def _parts(self):
+        """Utility method: the live contents as one or two slices of the array, in queue order"""
+        data = self._data
+        front = self._front
+        end = front + self._size
+        if end <= len(data):
+            return (data[front:end],)
+        return data[front:], data[:end - len(data)]
+
+    def _resize(self, capacity):
+        """Utility method: move the elements into a new array of the giving capacity, front at index 0"""
+        data = np.empty(capacity, dtype=self._data.dtype)
+        start = 0
+        for part in self._parts():
+            data[start:start + len(part)] = part
+            start += len(part)
+        self._data = data
+        self._front = 0
+
+    def _shrink(self):
+        """Utility method: halve the array while it is less than a quarter full"""
+        capacity = len(self._data)
+        while capacity > self.DEFAULT_CAPACITY and self._size < capacity // 4:
+            capacity //= 2
+        if capacity != len(self._data):
+            self._resize(capacity)
+
+    def enqueue(self, el):
+        """
+        Add a giving element to the end of the queue, doubling the array when it is full
+
+        Param el: number to be added, converted to the dtype of the queue
+
+        Returns: None (nothing)
+        """
+        data = self._data
+        if self._size == len(data):
+            self._resize(2 * len(data))
+            data = self._data
+        data[(self._front + self._size) % len(data)] = el
+        self._size += 1
+
+    def dequeue(self):
+        """
+        Remove an element from the front of the queue, halving the array when it is less than a quarter full
+
+        Returns: the removed element as a NumPy scalar
+        """
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        el = self._data[self._front]
+        self._front = (self._front + 1) % len(self._data)
+        self._size -= 1
+        self._shrink()
+        return el
+
+    def enqueue_many(self, values):
+        """
+        Add all the giving values to the end of the queue with at most two vectorized copies
+
+        Param values: array or iterable of numbers, converted to the dtype of the queue
+
+        Returns: None (nothing)
+        """
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        needed = self._size + len(values)
+        capacity = len(self._data)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        data = self._data
+        capacity = len(data)
+        back = (self._front + self._size) % capacity
+        first_part = min(len(values), capacity - back)
+        data[back:back + first_part] = values[:first_part]
+        data[:len(values) - first_part] = values[first_part:]
+        self._size = needed
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n elements from the front of the queue with at most two vectorized copies
+
+        Param n: maximum number of elements to remove
+
+        Returns: ndarray of the removed elements, in queue order
+        """
+        count = max(min(n, self._size), 0)
+        data = self._data
+        front = self._front
+        end = front + count
+        if end <= len(data):
+            items = data[front:end].copy()
+        else:
+            items = np.concatenate((data[front:], data[:end - len(data)]))
+        self._front = end % len(data)
+        self._size -= count
+        self._shrink()
+        return items
+
+    @classmethod
+    def from_iterable(cls, values, **kwargs):
+        """
+        Build a queue holding the giving values, first value at the front
+
+        Param values: array or iterable of numbers
+        Param kwargs: keyword arguments of the constructor (dtype, capacity)
+
+        Returns: the new queue
+        """
+        Q = cls(**kwargs)
+        Q.enqueue_many(values)
+        return Q
+
+    def first(self):
+        """Returns the first element in the queue"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return self._data[self._front]
+
+    def last(self):
+        """Returns the last element in the queue"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return self._data[(self._front + self._size - 1) % len(self._data)]
+
+    def view(self):
+        """
+        Returns a zero-copy, read-only view of the elements in queue order
+
+        If the elements wrap around the end of the ring, they are first moved to the front of
+        the array (one copy), after which views are zero-copy until they wrap again. The view
+        must not be used after the array was resized or the elements were moved.
+
+        Returns: ndarray
+        """
+        if self._front + self._size > len(self._data):
+            self._resize(len(self._data))
+        view = self._data[self._front:self._front + self._size]
+        view.flags.writeable = False
+        return view
+
+    def sum(self):
+        """Returns the sum of the elements (0 for an empty queue)"""
+        parts = self._parts()
+        total = parts[0].sum()
+        for part in parts[1:]:
+            total += part.sum()
+        return total
+
+    def mean(self):
+        """Returns the mean of the elements"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return self.sum() / self._size
+
+    def min(self):
+        """Returns the smallest element"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return min(part.min() for part in self._parts() if len(part))
+
+    def max(self):
+        """Returns the largest element"""
+        if self._size == 0:
+            raise Empty("Queue is empty")
+        return max(part.max() for part in self._parts() if len(part))
+
+    def __iter__(self):
+        """
+        Special method (iterator) to iterate over a snapshot of the queue, from the front
+
+        Returns: None (nothing)
+        """
+        items = []
+        for part in self._parts():
+            items.extend(part.tolist())
+        return iter(items)
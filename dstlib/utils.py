@@ -1,5 +1,6 @@
 class _Position:
     """Position class to assign a specific position to every added node"""
+    __slots__ = '_container', '_node'
 
     def __init__(self, container, node):
         self._container = container
@@ -9,6 +10,10 @@ class _Position:
         """Return True if other is a Position representing the same location."""
         return type(other) is type(self) and other._node is self._node
 
+    def __hash__(self):
+        """Return a hash consistent with __eq__, based on the identity of the node."""
+        return hash(self._node)
+
     def __ne__(self, other):
         """Return True if other does not represent the same location."""
         return not (self == other)
@@ -16,3 +21,13 @@ class _Position:
     def element(self):
         """Return the element stored at this Position."""
         return self._node._element
+
+
+class _NodePosition(_Position):
+    """Position of a linked node that also records the node's generation, which NodePool bumps on every reuse"""
+    __slots__ = '_generation',
+
+    def __init__(self, container, node):
+        self._container = container
+        self._node = node
+        self._generation = node._generation
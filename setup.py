@@ -6,6 +6,7 @@ setup(
     description='Data structures python library',
     url="https://github.com/algebra7/dstlib",
     packages=['dstlib'],
+    extras_require={'numpy': ['numpy']},
     author='Ahmad M Ameen',
     author_email='ahmadmameen7@gmail.com',
     long_description=open("README.rst").read(),
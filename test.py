@@ -1,6 +1,15 @@
+import asyncio
+import copy
+import pickle
+import threading
 import unittest
 import dstlib
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class LinkedListValuesTest(unittest.TestCase):
 
@@ -73,6 +82,521 @@ class LinkedListValuesTest(unittest.TestCase):
 
 
 
+class LinkedListSortTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        records = [(3, 'a'), (1, 'b'), (2, 'c'), (1, 'd'), (3, 'e'), (2, 'f')]
+        positions = [L.add_last(r) for r in records]
+        L.sort(key=lambda r: r[0])
+        self.assertEqual(list(L), sorted(records, key=lambda r: r[0]))
+        L.sort(key=lambda r: r[0], reverse=True)
+        self.assertEqual(list(L), sorted(records, key=lambda r: r[0], reverse=True))
+        self.assertEqual(len(L), 6)
+
+        for p, r in zip(positions, records):
+            self.assertEqual(p.element(), r)
+        self.assertEqual(L.first_position(), positions[0])
+        self.assertEqual(L.last_position(), positions[3])
+        self.assertEqual(L.position_after(positions[0]), positions[4])
+        self.assertEqual(L.position_before(positions[4]), positions[0])
+
+        L.delete(positions[2])
+        L.sort()
+        self.assertEqual(list(L), [(1, 'b'), (1, 'd'), (2, 'f'), (3, 'a'), (3, 'e')])
+        L.reverse()
+        self.assertEqual(L[0], (3, 'e'))
+
+        E = dstlib.LinkedList()
+        E.sort()
+        self.assertTrue(E.is_empty())
+
+        M = dstlib.LinkedList.from_iterable([3, 1, 'a', 2, 0])
+        self.assertRaises(TypeError, M.sort)
+        self.assertEqual(list(M), [3, 1, 'a', 2, 0])
+        self.assertEqual(list(reversed(M)), [0, 2, 'a', 1, 3])
+        self.assertEqual(len(M), 5)
+
+
+
+class SortedMergeTest(unittest.TestCase):
+
+    def test_match(self):
+        for kwargs in ({}, {"indexed": True, "index_values": True}):
+            L = dstlib.LinkedList.from_iterable([(1, 'a'), (4, 'a'), (6, 'a')], **kwargs)
+            L2 = dstlib.LinkedList.from_iterable([(0, 'b'), (4, 'b'), (9, 'b')])
+            L3 = dstlib.LinkedList.from_iterable([(4, 'c'), (5, 'c')], **kwargs)
+            p = L.first_position()
+            q = L2.first_position()
+            L.merge(L2, dstlib.LinkedList(), L3, key=lambda item: item[0])
+            self.assertEqual(list(L), [(0, 'b'), (1, 'a'), (4, 'a'), (4, 'b'), (4, 'c'),
+                                       (5, 'c'), (6, 'a'), (9, 'b')])
+            self.assertEqual(list(reversed(L))[0], (9, 'b'))
+            self.assertEqual((len(L), len(L2), len(L3)), (8, 0, 0))
+            self.assertEqual(L.index_of(p), 1)
+            self.assertRaises(ValueError, L2.delete, q)
+            self.assertIn((5, 'c'), L)
+            self.assertEqual(L[7], (9, 'b'))
+
+            p = L.insort((4, 'd'), key=lambda item: item[0])
+            self.assertEqual(L.index_of(p), 5)
+            p = L.insort((-1, 'd'))
+            self.assertEqual(L.index_of(p), 0)
+            p = L.insort((10, 'd'))
+            self.assertEqual(L.index_of(p), 10)
+            self.assertEqual(list(L), sorted(L, key=lambda item: item[0]))
+
+        L = dstlib.LinkedList()
+        for x in (5, 1, 4, 1, 3):
+            L.insort(x)
+        self.assertEqual(list(L), [1, 1, 3, 4, 5])
+        L.merge(dstlib.LinkedList.from_iterable([2, 6]))
+        self.assertEqual(list(L), [1, 1, 2, 3, 4, 5, 6])
+        self.assertRaises(ValueError, L.merge, L)
+        self.assertRaises(TypeError, L.merge, [1])
+
+
+
+class LinkedListIndexAccessTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        expected = []
+        for i in range(20):
+            L.append(i)
+            expected.append(i)
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+
+        L.insert(10, 'a')
+        expected.insert(10, 'a')
+        L.prepend('b')
+        expected.insert(0, 'b')
+        self.assertEqual(L[11], 'a')
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+
+        p = L.first_position()
+        for _ in range(5):
+            p = L.position_after(p)
+        L.delete(p)
+        del expected[5]
+        L.add_before(L.last_position(), 'c')
+        expected.insert(len(expected) - 1, 'c')
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+
+        L.reverse()
+        expected.reverse()
+        self.assertEqual([L[i] for i in range(len(L) - 1, -1, -1)], expected[::-1])
+        L.delete(L.first_position())
+        del expected[0]
+        self.assertEqual(list(L), expected)
+        self.assertEqual(L[0], expected[0])
+
+
+
+class IndexedLinkedListTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList(indexed=True)
+        expected = []
+        for i in range(200):
+            j = (i * 7) % (len(expected) + 1)
+            L.insert(j, i)
+            expected.insert(j, i)
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+
+        p = L.add_after(L.first_position(), 'x')
+        expected.insert(1, 'x')
+        self.assertEqual(L.index_of(p), 1)
+        self.assertEqual(L.index_of(L.last_position()), len(L) - 1)
+        L.delete(L.position_after(p))
+        del expected[2]
+        self.assertEqual(L.index_of(p), 1)
+        self.assertEqual(L[2], expected[2])
+
+        L.reverse()
+        expected.reverse()
+        self.assertEqual(L.index_of(p), len(L) - 2)
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+
+        L.delete(p)
+        expected.remove('x')
+        L.sort()
+        expected.sort()
+        self.assertEqual([L[i] for i in range(len(L))], expected)
+        self.assertEqual(list(L), expected)
+
+        U = dstlib.LinkedList()
+        for i in range(5):
+            U.append(i)
+        self.assertEqual(U.index_of(U.last_position()), 4)
+
+
+
+class SpliceTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        for i in (1, 2, 6):
+            L.append(i)
+        self.assertEqual(L[1], 2)
+        L2 = dstlib.LinkedList()
+        for i in (3, 4, 5):
+            L2.append(i)
+        p6 = L.last_position()
+        L.splice(p6, L2)
+        self.assertEqual(list(L), [1, 2, 3, 4, 5, 6])
+        self.assertEqual([L[i] for i in range(len(L))], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(L.position_before(p6).element(), 5)
+        self.assertEqual(len(L2), 0)
+        self.assertEqual(list(L2), [])
+
+        L2.append(7)
+        L2.add_first(0)
+        self.assertEqual(list(L2), [0, 7])
+        L.concat(L2)
+        L.splice(L.first_position(), dstlib.LinkedList())
+        self.assertEqual(list(L), [1, 2, 3, 4, 5, 6, 0, 7])
+        self.assertEqual(L.last_position().element(), 7)
+        self.assertTrue(L2.is_empty())
+
+        I = dstlib.LinkedList(indexed=True)
+        I.append('a')
+        I.concat(L)
+        self.assertEqual(I[8], 7)
+        self.assertEqual(I.index_of(I.last_position()), 8)
+
+        Q = dstlib.Queue()
+        Q2 = dstlib.Queue()
+        Q2.enqueue(1)
+        Q.concat_detroy(Q2)
+        Q2.enqueue(2)
+        Q2.enqueue(3)
+        Q.concat_detroy(Q2)
+        self.assertEqual(list(Q), [1, 2, 3])
+        self.assertEqual(Q.last(), 3)
+        self.assertTrue(Q2.is_empty())
+        Q2.enqueue(4)
+        self.assertEqual(list(Q2), [4])
+
+
+
+class ValueSearchTest(unittest.TestCase):
+
+    def test_match(self):
+        for kwargs in ({}, {"index_values": True}, {"index_values": True, "indexed": True}):
+            L = dstlib.LinkedList.from_iterable([5, 3, 8, 3, 1], **kwargs)
+            self.assertIn(3, L)
+            self.assertNotIn(4, L)
+            self.assertEqual(L.index(3), 1)
+            self.assertEqual(L.find(8).element(), 8)
+            self.assertIsNone(L.find(4))
+            self.assertRaises(ValueError, L.index, 4)
+            self.assertRaises(ValueError, L.remove, 4)
+
+            L.remove(3)
+            self.assertEqual(list(L), [5, 8, 3, 1])
+            self.assertEqual(L.index(3), 2)
+            L.sort()
+            self.assertEqual(L.index(3), 1)
+            L.replace(L.find(3), 4)
+            self.assertNotIn(3, L)
+            self.assertEqual(L.index(4), 1)
+            L.delete(L.find(1))
+            self.assertNotIn(1, L)
+
+            L2 = dstlib.LinkedList.from_iterable([9, 4])
+            L.concat(L2)
+            self.assertIn(9, L)
+            self.assertNotIn(9, L2)
+            L.add_first(9)
+            self.assertEqual(L.index(9), 0)
+            L.move_to_back(L.first_position())
+            self.assertEqual(L.index(9), 3)
+            L.extendleft([7])
+            self.assertEqual(L.find(7), L.first_position())
+            self.assertEqual(list(L), [7, 4, 5, 8, 9, 4, 9])
+
+        L = dstlib.LinkedList(index_values=True)
+        self.assertRaises(TypeError, L.append, [1])
+        self.assertRaises(TypeError, L.extend, [1, [2]])
+        self.assertEqual(list(L), [1])
+        self.assertIn(1, L)
+        L.replace(L.first_position(), 2)
+        self.assertNotIn(1, L)
+        self.assertEqual(L.index(2), 0)
+
+
+
+class BulkFilteringTest(unittest.TestCase):
+
+    def test_match(self):
+        for kwargs in ({}, {"indexed": True, "index_values": True}, {"pool": dstlib.NodePool()}):
+            L = dstlib.LinkedList.from_iterable(range(10), **kwargs)
+            self.assertEqual(L.remove_if(lambda x: x % 3 == 0), 4)
+            self.assertEqual(list(L), [1, 2, 4, 5, 7, 8])
+            self.assertEqual(L[4], 7)
+            self.assertNotIn(3, L)
+            self.assertEqual(L.remove_if(lambda x: False), 0)
+
+            p = L.first_position()
+            odd = L.partition(lambda x: x % 2)
+            self.assertEqual(list(L), [2, 4, 8])
+            self.assertEqual(list(odd), [1, 5, 7])
+            self.assertEqual((len(L), len(odd)), (3, 3))
+            self.assertEqual(odd.index(7), 2)
+            self.assertRaises(ValueError, L.delete, p)
+            odd.append(9)
+            self.assertEqual(odd.last_position().element(), 9)
+
+            D = dstlib.LinkedList.from_iterable([1, 1, 2, 3, 3, 1, 2], **kwargs)
+            self.assertEqual(D.dedupe(consecutive=True), 2)
+            self.assertEqual(list(D), [1, 2, 3, 1, 2])
+            self.assertEqual(D.dedupe(), 2)
+            self.assertEqual(list(D), [1, 2, 3])
+            self.assertEqual(D.dedupe(key=lambda x: x % 2), 1)
+            self.assertEqual(list(D), [1, 2])
+            self.assertEqual(D.index(2), 1)
+
+        L = dstlib.LinkedList.from_iterable(range(5))
+
+        def failing(x):
+            if x == 3:
+                raise KeyError(x)
+            return x % 2 == 0
+
+        self.assertRaises(KeyError, L.remove_if, failing)
+        self.assertEqual(list(L), [1, 3, 4])
+        self.assertEqual(list(reversed(L)), [4, 3, 1])
+        self.assertEqual(len(L), 3)
+
+
+
+class LinkedListIterationTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        expected = list(range(10))
+        for i in expected:
+            L.append(i)
+        self.assertEqual(list(L), expected)
+        self.assertEqual(list(reversed(L)), expected[::-1])
+        self.assertEqual(list(L[2:8:2]), [2, 4, 6])
+        self.assertEqual(list(L[::-3]), [9, 6, 3, 0])
+        self.assertEqual(list(L[-3:]), [7, 8, 9])
+        self.assertEqual(len(L[1:9:3]), 3)
+        self.assertEqual(list(reversed(L[1:9:3])), [7, 4, 1])
+        self.assertEqual(list(L[5:2]), [])
+        self.assertEqual(list(L.islice(3)), [0, 1, 2])
+        self.assertEqual(list(L.islice(4, None, 4)), [4, 8])
+
+        view = L[:3]
+        with self.assertRaises(RuntimeError):
+            for el in L:
+                L.append(el)
+        self.assertRaises(RuntimeError, list, view)
+        with self.assertRaises(RuntimeError):
+            for el in reversed(L):
+                L.delete(L.first_position())
+        p = L.first_position()
+        L.replace(p, 'a')
+        self.assertEqual(next(iter(L)), 'a')
+
+
+
+class NodePoolTest(unittest.TestCase):
+
+    def test_match(self):
+        pool = dstlib.NodePool(maxsize=2)
+        Q = dstlib.Queue(pool=pool)
+        S = dstlib.Stack(pool=pool)
+        L = dstlib.LinkedList(pool=pool)
+        for i in range(3):
+            Q.enqueue(i)
+        self.assertEqual((pool.hits, pool.misses), (0, 3))
+        self.assertEqual([Q.dequeue() for _ in range(3)], [0, 1, 2])
+        self.assertEqual(len(pool), 2)
+        S.push('a')
+        L.append('b')
+        self.assertEqual(pool.stats(), {"hits": 2, "misses": 3, "free": 0})
+        L.append('c')
+        self.assertEqual(list(L), ['b', 'c'])
+        self.assertEqual(L.delete(L.first_position()), 'b')
+        self.assertEqual(S.pop(), 'a')
+        Q.enqueue('d')
+        self.assertEqual(list(Q), ['d'])
+        self.assertEqual(list(L), ['c'])
+        self.assertTrue(S.is_empty())
+        self.assertEqual(pool.stats(), {"hits": 3, "misses": 4, "free": 1})
+
+        pool = dstlib.NodePool()
+        A = dstlib.LinkedList(pool=pool)
+        B = dstlib.LinkedList(pool=pool)
+        p = A.add_last('a')
+        A.add_last('x')
+        A.delete(p)
+        B.add_last('b')
+        B.add_last('c')
+        self.assertRaises(ValueError, A.delete, p)
+        self.assertEqual((list(A), list(B)), (['x'], ['b', 'c']))
+        q = B.first_position()
+        B.delete(q)
+        A.add_first('y')
+        self.assertRaises(ValueError, B.delete, q)
+        self.assertEqual((list(A), list(B)), (['y', 'x'], ['c']))
+        Q = dstlib.Queue(pool=pool)
+        p = Q.enqueue_position(1)
+        Q.dequeue()
+        Q.enqueue(2)
+        self.assertRaises(ValueError, Q._validate, p)
+
+
+
+class BulkOperationsTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList.from_iterable(range(3))
+        L.extend([3, 4])
+        L.extendleft(['b', 'a'])
+        self.assertEqual(list(L), ['a', 'b', 0, 1, 2, 3, 4])
+        self.assertEqual(len(L), 7)
+        self.assertEqual(L[6], 4)
+        self.assertEqual(L.position_before(L.last_position()).element(), 3)
+        L.extend(L)
+        self.assertEqual(len(L), 14)
+        I = dstlib.LinkedList.from_iterable('xyz', indexed=True)
+        I.extendleft('w')
+        self.assertEqual(I.index_of(I.last_position()), 3)
+
+        Q = dstlib.Queue.from_iterable([1, 2])
+        Q.enqueue_many(range(3, 6))
+        self.assertEqual(Q.dequeue_many(2), [1, 2])
+        self.assertEqual(Q.dequeue_many(10), [3, 4, 5])
+        self.assertTrue(Q.is_empty())
+        self.assertEqual(Q.dequeue_many(1), [])
+        Q.enqueue_many('ab')
+        self.assertEqual((Q.first(), Q.last()), ('a', 'b'))
+
+        def failing():
+            yield 10
+            yield 11
+            raise KeyError("source failed")
+
+        Q = dstlib.Queue.from_iterable([1, 2])
+        self.assertRaises(KeyError, Q.enqueue_many, failing())
+        self.assertEqual(len(Q), 2)
+        self.assertEqual(list(Q), [1, 2])
+        self.assertEqual(Q.dequeue_many(5), [1, 2])
+
+        S = dstlib.Stack.from_iterable([1, 2, 3])
+        self.assertEqual(S.top(), 3)
+        S.push_many([4, 5])
+        self.assertEqual(S.pop_many(3), [5, 4, 3])
+        self.assertEqual(S.pop_many(5), [2, 1])
+        self.assertTrue(S.is_empty())
+
+        A = dstlib.ArrayQueue.from_iterable(range(20))
+        self.assertEqual(A.dequeue_many(18), list(range(18)))
+        A.enqueue_many(range(20, 30))
+        self.assertEqual(list(A), list(range(18, 30)))
+
+        B = dstlib.BlockingQueue.from_iterable('abc')
+        self.assertEqual(B.dequeue_many(2), ['a', 'b'])
+
+
+
+class MovePositionsTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        positions = {L.add_last(k): k for k in 'abcd'}
+        self.assertEqual(positions[L.first_position()], 'a')
+        self.assertEqual(positions[L.last_position()], 'd')
+        self.assertEqual(len({L.first_position(), L.first_position()}), 1)
+
+        pa = L.first_position()
+        pd = L.last_position()
+        L.move_to_back(pa)
+        self.assertEqual(list(L), ['b', 'c', 'd', 'a'])
+        L.move_to_front(pd)
+        self.assertEqual(list(L), ['d', 'b', 'c', 'a'])
+        pb = L.position_after(pd)
+        L.move_after(pd, pa)
+        self.assertEqual(list(L), ['b', 'c', 'a', 'd'])
+        L.move_before(pa, pb)
+        self.assertEqual(list(L), ['a', 'b', 'c', 'd'])
+        L.move_before(pa, pb)
+        self.assertEqual(list(L), ['a', 'b', 'c', 'd'])
+        self.assertEqual(list(reversed(L)), ['d', 'c', 'b', 'a'])
+        self.assertEqual(pa.element(), 'a')
+        self.assertEqual(L.delete(pa), 'a')
+        self.assertRaises(ValueError, L.move_to_front, pa)
+        self.assertRaises(ValueError, L.move_after, pb, pb)
+        self.assertEqual(L[2], 'd')
+
+
+
+class CompactNodesTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList()
+        Q = dstlib.Queue()
+        S = dstlib.Stack()
+        positions = [L.add_last(1), Q.enqueue_position(2), S.push_position(3)]
+        for p in positions:
+            self.assertFalse(hasattr(p, '__dict__'))
+            self.assertFalse(hasattr(p._node, '__dict__'))
+        self.assertEqual([p.element() for p in positions], [1, 2, 3])
+
+
+
+class CacheTest(unittest.TestCase):
+
+    def test_match(self):
+        evicted = []
+        C = dstlib.LRUCache(maxsize=2, on_evict=lambda k, v: evicted.append((k, v)))
+        C.put('a', 1)
+        C.put('b', 2)
+        self.assertEqual(C.get('a'), 1)
+        C.put('c', 3)
+        self.assertEqual(evicted, [('b', 2)])
+        self.assertIsNone(C.get('b'))
+        self.assertEqual(C.keys(), ['c', 'a'])
+        C.put('a', 10)
+        self.assertEqual(C.keys(), ['a', 'c'])
+        self.assertEqual(C.pop('c'), 3)
+        self.assertEqual(len(C), 1)
+        self.assertTrue('a' in C)
+        self.assertEqual(C.stats(), {"hits": 1, "misses": 1, "evictions": 1, "size": 1, "maxsize": 2})
+
+        F = dstlib.LFUCache(maxsize=2)
+        F.put('a', 1)
+        F.put('b', 2)
+        F.get('a')
+        F.get('a')
+        F.get('b')
+        self.assertEqual((F.frequency('a'), F.frequency('b')), (3, 2))
+        F.put('c', 3)
+        self.assertFalse('b' in F)
+        F.put('d', 4)
+        self.assertFalse('c' in F)
+        self.assertEqual(F.get('a'), 1)
+        self.assertEqual(F.stats()["evictions"], 2)
+        self.assertEqual(F.pop('d'), 4)
+        self.assertEqual(len(F), 1)
+
+        calls = []
+
+        @dstlib.LRUCache(maxsize=8)
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual([square(3), square(3), square(3, offset=1), square(4)], [9, 9, 10, 16])
+        self.assertEqual(calls, [3, 3, 4])
+        self.assertEqual(square.cache.stats()["hits"], 1)
+
+
+
 class QueueValuesTest(unittest.TestCase):
     
     def test_match(self):
@@ -119,6 +643,524 @@ class QueueValuesTest(unittest.TestCase):
         self.assertEqual(pl.element(), 10)
 
 
+class PriorityQueueTest(unittest.TestCase):
+
+    def test_match(self):
+        PQ = dstlib.PriorityQueue()
+        self.assertTrue(PQ.is_empty())
+        self.assertIsNone(PQ.first_position())
+        self.assertRaises(dstlib.Empty, PQ.pop)
+        positions = {name: PQ.push(name, priority) for name, priority in
+                     [('a', 5), ('b', 3), ('c', 8), ('d', 3), ('e', 7)]}
+        self.assertEqual(len(PQ), 5)
+        self.assertEqual(PQ.first(), (3, 'b'))
+        self.assertEqual(positions['c'].priority(), 8)
+
+        PQ.decrease_key(positions['c'], 1)
+        self.assertEqual(PQ.first_position(), positions['c'])
+        self.assertRaises(ValueError, PQ.decrease_key, positions['a'], 6)
+        self.assertEqual(PQ.remove(positions['e']), (7, 'e'))
+        self.assertRaises(ValueError, PQ.remove, positions['e'])
+        PQ.update(positions['c'], 9)
+        self.assertEqual(sorted(PQ), ['a', 'b', 'c', 'd'])
+        self.assertEqual([PQ.pop() for _ in range(4)], [(3, 'b'), (3, 'd'), (5, 'a'), (9, 'c')])
+        self.assertRaises(ValueError, PQ.update, positions['a'], 0)
+        self.assertRaises(ValueError, dstlib.PriorityQueue().remove, PQ.push('x', 0))
+        self.assertRaises(TypeError, PQ.remove, 'x')
+
+        import random
+        rng = random.Random(5)
+        PQ = dstlib.PriorityQueue()
+        live = []
+        for i in range(300):
+            live.append(PQ.push(i, rng.randrange(100)))
+            if i % 3 == 0:
+                p = rng.choice(live)
+                PQ.decrease_key(p, p.priority() - rng.randrange(50))
+            if i % 7 == 0:
+                PQ.remove(live.pop(rng.randrange(len(live))))
+        expected = [p.element() for p in sorted(live, key=lambda p: (p.priority(), p.element()))]
+        self.assertEqual([PQ.pop()[1] for _ in range(len(PQ))], expected)
+
+
+
+class AggregateTest(unittest.TestCase):
+
+    def test_match(self):
+        import operator
+        S = dstlib.AggregateStack(op=operator.add)
+        self.assertRaises(dstlib.Empty, S.min)
+        S.push_many([5, 2, 8])
+        self.assertEqual((S.min(), S.max(), S.reduce()), (2, 8, 15))
+        S.push(1)
+        self.assertEqual((S.min(), S.reduce()), (1, 16))
+        self.assertEqual(S.pop(), 1)
+        self.assertEqual(S.pop_many(2), [8, 2])
+        self.assertEqual((S.min(), S.max(), S.reduce()), (5, 5, 5))
+        self.assertRaises(TypeError, dstlib.AggregateStack().reduce)
+
+        import random
+        rng = random.Random(2)
+        data = [rng.randrange(1000) for _ in range(400)]
+        Q = dstlib.AggregateQueue(op=operator.add)
+        C = dstlib.AggregateQueue(op=operator.concat)
+        window = 25
+        for i, x in enumerate(data):
+            Q.enqueue(x)
+            C.enqueue(str(x) + ',')
+            if len(Q) > window:
+                self.assertEqual(Q.dequeue(), data[i - window])
+                C.dequeue()
+            current = data[max(0, i - window + 1):i + 1]
+            self.assertEqual((Q.min(), Q.max(), Q.reduce()), (min(current), max(current), sum(current)))
+            self.assertEqual(C.reduce(), ''.join(str(x) + ',' for x in current))
+            self.assertEqual((Q.first(), Q.last()), (current[0], current[-1]))
+        self.assertEqual(list(Q), current)
+
+        Q = dstlib.AggregateQueue.from_iterable([3, 1, 2])
+        self.assertEqual(Q.dequeue_many(2), [3, 1])
+        self.assertEqual(Q.try_dequeue(), (True, 2))
+        self.assertEqual(Q.dequeue_or('empty'), 'empty')
+        self.assertRaises(dstlib.Empty, Q.max)
+        self.assertRaises(dstlib.Empty, Q.last)
+
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TypedStructuresTest(unittest.TestCase):
+
+    def test_match(self):
+        S = dstlib.TypedStack(numpy.int64, capacity=2)
+        self.assertRaises(dstlib.Empty, S.pop)
+        for i in range(5):
+            S.push(i)
+        S.push_many(numpy.arange(5, 40))
+        self.assertEqual(len(S), 40)
+        self.assertEqual(S.top(), 39)
+        self.assertEqual(S.sum(), sum(range(40)))
+        self.assertEqual((S.min(), S.max()), (0, 39))
+        self.assertEqual(S.pop(), 39)
+        self.assertEqual(S.pop_many(3).tolist(), [38, 37, 36])
+        view = S.view()
+        self.assertEqual(view.tolist(), list(range(36)))
+        self.assertFalse(view.flags.writeable)
+        self.assertEqual(list(S)[:2], [35, 34])
+        self.assertEqual(len(S.pop_many(100)), 36)
+        self.assertTrue(S.is_empty())
+        self.assertEqual(len(S._data), S.DEFAULT_CAPACITY)
+
+        Q = dstlib.TypedQueue(numpy.float64, capacity=4)
+        self.assertRaises(dstlib.Empty, Q.dequeue)
+        Q.enqueue_many([1, 2, 3])
+        self.assertEqual(Q.dequeue(), 1.0)
+        Q.enqueue_many([4, 5, 6])
+        self.assertEqual(list(Q), [2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual((Q.first(), Q.last()), (2.0, 6.0))
+        self.assertEqual((Q.sum(), Q.mean(), Q.min(), Q.max()), (20.0, 4.0, 2.0, 6.0))
+        self.assertEqual(Q.dequeue_many(2).tolist(), [2.0, 3.0])
+        Q.enqueue_many(numpy.arange(7, 12))
+        self.assertEqual(len(Q._parts()), 2)
+        self.assertEqual(Q.view().tolist(), [4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0])
+        Q.enqueue(12)
+        self.assertEqual(Q.dequeue_many(100).tolist(), list(range(4, 13)))
+        self.assertTrue(Q.is_empty())
+        Q = dstlib.TypedQueue.from_iterable(range(3), dtype=numpy.int32)
+        self.assertEqual(Q.dtype, numpy.int32)
+        self.assertEqual(Q.dequeue_many(5).tolist(), [0, 1, 2])
+
+
+class ArrayQueueValuesTest(unittest.TestCase):
+
+    def test_match(self):
+        Q = dstlib.ArrayQueue()
+        self.assertTrue(Q.is_empty())
+        for i in range(100):
+            self.assertIsNone(Q.enqueue(i))
+        self.assertEqual(len(Q), 100)
+        for i in range(90):
+            self.assertEqual(Q.dequeue(), i)
+        self.assertEqual(len(Q._data), 32)
+        self.assertEqual(Q.first(), 90)
+        self.assertEqual(Q.last(), 99)
+        self.assertIsNone(Q.rotate())
+        self.assertEqual(Q.first(), 91)
+        self.assertEqual(Q.last(), 90)
+        self.assertEqual(list(Q), list(range(91, 100)) + [90])
+
+        Q2 = dstlib.ArrayQueue()
+        Q2.enqueue('a')
+        Q.concat(Q2)
+        self.assertEqual(Q.last(), 'a')
+        self.assertEqual(len(Q2), 1)
+
+
+
+class BlockingQueueTest(unittest.TestCase):
+
+    def test_match(self):
+        Q = dstlib.BlockingQueue(maxsize=2)
+        Q.put(1)
+        Q.put(2)
+        self.assertRaises(dstlib.Full, Q.put, 3, timeout=0.01)
+        self.assertEqual(Q.get(), 1)
+        self.assertEqual(Q.get_many(5), [2])
+        self.assertEqual(Q.get_many(5, timeout=0.01), [])
+
+        results = []
+
+        def consume():
+            try:
+                while True:
+                    results.extend(Q.get_many(3))
+            except dstlib.Closed:
+                pass
+
+        consumers = [threading.Thread(target=consume) for _ in range(4)]
+        for c in consumers:
+            c.start()
+        producers = [threading.Thread(target=Q.put_many, args=(range(k, 400, 4),)) for k in range(4)]
+        for p in producers:
+            p.start()
+        for p in producers:
+            p.join()
+        Q.close()
+        for c in consumers:
+            c.join()
+        self.assertEqual(sorted(results), list(range(400)))
+        self.assertTrue(Q.is_closed())
+        self.assertRaises(dstlib.Closed, Q.put, 1)
+
+        Q = dstlib.BlockingQueue()
+        Q.put_many('abc')
+        self.assertEqual(list(Q), ['a', 'b', 'c'])
+        self.assertEqual(Q.drain(), ['a', 'b', 'c'])
+        self.assertTrue(Q.is_empty())
+
+        Q = dstlib.BlockingQueue(maxsize=2)
+        got = []
+        getter = threading.Thread(target=lambda: got.append(Q.get(timeout=5)))
+        getter.start()
+        Q.concat_detroy(dstlib.Queue.from_iterable(['x']))
+        getter.join(timeout=1)
+        self.assertEqual(got, ['x'])
+        producer = threading.Thread(target=Q.concat_detroy, args=(dstlib.Queue.from_iterable(range(4)),))
+        producer.start()
+        self.assertEqual([Q.get(timeout=5) for _ in range(4)], [0, 1, 2, 3])
+        producer.join()
+        Q.concat(dstlib.Queue.from_iterable('ab'))
+        Q.rotate()
+        self.assertEqual(list(Q), ['b', 'a'])
+        self.assertRaises(dstlib.Full, Q.put, 'c', timeout=0.01)
+
+        B = dstlib.BlockingQueue(maxsize=1)
+        B.put(1)
+        producer = threading.Thread(target=B.put, args=(2,), daemon=True)
+        producer.start()
+        producer.join(timeout=0.05)
+        self.assertTrue(producer.is_alive())
+        A = dstlib.BlockingQueue()
+        A.concat_detroy(B)
+        producer.join(timeout=5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual((list(A), list(B)), ([1], [2]))
+
+
+
+def _shared_queue_worker(Q, results):
+    results.put([Q.get(timeout=5) for _ in range(3)])
+    Q.close()
+
+
+class SharedQueueTest(unittest.TestCase):
+
+    def test_match(self):
+        import multiprocessing
+        with dstlib.SharedQueue(slots=4, slot_size=16) as Q:
+            self.assertTrue(Q.is_empty())
+            self.assertEqual(Q.max_record_size, 12)
+            self.assertRaises(dstlib.Empty, Q.dequeue)
+            self.assertRaises(ValueError, Q.enqueue, b'x' * 13)
+            for record in (b'a', b'bc', bytearray(b'def'), memoryview(b'ghij')):
+                Q.enqueue(record)
+            self.assertRaises(dstlib.Full, Q.enqueue, b'k')
+            self.assertRaises(dstlib.Full, Q.put, b'k', timeout=0.01)
+            self.assertEqual(len(Q), 4)
+            self.assertEqual(Q.first(), b'a')
+            with Q.first_view() as view:
+                self.assertEqual(view.tobytes(), b'a')
+            self.assertEqual(Q.dequeue(), b'a')
+            buffer = bytearray(Q.max_record_size)
+            size = Q.dequeue_into(buffer)
+            self.assertEqual(bytes(buffer[:size]), b'bc')
+            for i in range(5):
+                Q.enqueue(b'%d' % i)
+                Q.dequeue()
+            self.assertEqual([Q.get(timeout=0.01) for _ in range(2)], [b'3', b'4'])
+            self.assertRaises(dstlib.Empty, Q.get, timeout=0.01)
+
+            ctx = multiprocessing.get_context()
+            results = ctx.Queue()
+            process = ctx.Process(target=_shared_queue_worker, args=(Q, results))
+            process.start()
+            for record in (b'x', b'y', b'z'):
+                Q.put(record)
+            self.assertEqual(results.get(timeout=10), [b'x', b'y', b'z'])
+            process.join()
+
+
+
+class PersistentQueueTest(unittest.TestCase):
+
+    def test_match(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            Q = dstlib.PersistentQueue(directory, segment_size=256, fsync_every=10, cache_size=8)
+            self.assertTrue(Q.is_empty())
+            self.assertRaises(dstlib.Empty, Q.dequeue)
+            Q.enqueue_many(range(100))
+            Q.enqueue({"big": "x" * 1000})
+            self.assertEqual(len(Q), 101)
+            self.assertEqual(Q.first(), 0)
+            self.assertEqual([Q.dequeue() for _ in range(60)], list(range(60)))
+            Q.flush()
+            segments = [name for name in os.listdir(directory) if name.endswith('.seg')]
+            del Q
+
+            Q = dstlib.PersistentQueue(directory, segment_size=256, fsync_every=0)
+            self.assertEqual(len(Q), 41)
+            self.assertEqual(list(Q)[:3], [60, 61, 62])
+            self.assertEqual(Q.dequeue(), 60)
+            self.assertEqual(Q.dequeue(), 61)
+            del Q
+
+            Q = dstlib.PersistentQueue(directory, segment_size=256)
+            self.assertEqual(Q.dequeue(), 60)
+            self.assertEqual([Q.dequeue() for _ in range(40)][-1], {"big": "x" * 1000})
+            self.assertTrue(Q.is_empty())
+            Q.enqueue('a')
+            Q.close()
+            self.assertLess(len([name for name in os.listdir(directory) if name.endswith('.seg')]), len(segments))
+
+            Q = dstlib.PersistentQueue(directory, high_watermark=5, segment_size=256)
+            self.assertEqual(Q.dequeue(), 'a')
+            Q.enqueue_many(range(12))
+            self.assertEqual(Q.dequeue_many(2), [0, 1])
+            Q.close()
+            with dstlib.PersistentQueue(directory, high_watermark=5, segment_size=256) as Q:
+                self.assertEqual(list(Q), list(range(2, 12)))
+                self.assertEqual([Q.dequeue() for _ in range(4)], [2, 3, 4, 5])
+            with dstlib.PersistentQueue(directory, segment_size=256) as Q:
+                self.assertEqual(Q.try_dequeue(), (True, 6))
+                for segment in sorted(name for name in os.listdir(directory) if name.endswith('.seg'))[-1:]:
+                    with open(os.path.join(directory, segment), 'r+b') as file:
+                        file.seek(Q._write_offset)
+                        file.write(b'garbage')
+            with dstlib.PersistentQueue(directory, segment_size=256) as Q:
+                self.assertEqual(list(Q), list(range(7, 12)))
+                Q.enqueue(12)
+                self.assertEqual([Q.dequeue() for _ in range(6)], list(range(7, 13)))
+                self.assertEqual(Q.dequeue_or('empty'), 'empty')
+
+
+
+class AsyncStructuresTest(unittest.TestCase):
+
+    def test_match(self):
+        async def scenario():
+            Q = dstlib.AsyncQueue(maxsize=2)
+            received = []
+
+            async def consume():
+                while len(received) < 10:
+                    received.extend(await Q.get_batch(4))
+
+            consumer = asyncio.ensure_future(consume())
+            for i in range(10):
+                await Q.put(i)
+                self.assertLessEqual(len(Q), 2)
+            await consumer
+            self.assertEqual(received, list(range(10)))
+            self.assertEqual(await Q.get_batch(4, timeout=0.01), [])
+
+            getter = asyncio.ensure_future(Q.get())
+            await asyncio.sleep(0)
+            await Q.put('x')
+            self.assertEqual(await getter, 'x')
+
+            getter = asyncio.ensure_future(Q.get())
+            await asyncio.sleep(0)
+            Q.enqueue('y')
+            self.assertEqual(await asyncio.wait_for(getter, 1), 'y')
+            Q.enqueue(1)
+            Q.enqueue(2)
+            self.assertRaises(dstlib.Full, Q.enqueue, 3)
+            self.assertRaises(dstlib.Full, Q.concat_detroy, dstlib.Queue.from_iterable([3]))
+            putter = asyncio.ensure_future(Q.put(3))
+            await asyncio.sleep(0)
+            self.assertEqual(Q.dequeue(), 1)
+            await asyncio.wait_for(putter, 1)
+            self.assertEqual(Q.dequeue_many(5), [2, 3])
+            self.assertRaises(dstlib.Empty, Q.dequeue)
+            getter = asyncio.ensure_future(Q.get())
+            await asyncio.sleep(0)
+            Q.concat_detroy(dstlib.Queue.from_iterable(['z']))
+            self.assertEqual(await asyncio.wait_for(getter, 1), 'z')
+
+            B = dstlib.AsyncQueue(maxsize=1)
+            await B.put(1)
+            putter = asyncio.ensure_future(B.put(2))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            A = dstlib.AsyncQueue()
+            A.concat_detroy(B)
+            await asyncio.wait_for(putter, 1)
+            self.assertEqual((list(A), list(B)), ([1], [2]))
+
+            S = dstlib.AsyncStack(maxsize=1)
+            await S.push(1)
+            pusher = asyncio.ensure_future(S.push(2))
+            await asyncio.sleep(0)
+            self.assertFalse(pusher.done())
+            self.assertEqual(await S.pop(), 1)
+            await pusher
+            self.assertEqual(list(S), [2])
+            self.assertEqual(await S.pop(), 2)
+
+            popper = asyncio.ensure_future(S.pop())
+            await asyncio.sleep(0)
+            popper.cancel()
+            await asyncio.gather(popper, return_exceptions=True)
+            self.assertEqual(len(S._poppers), 0)
+
+        asyncio.run(scenario())
+
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def test_match(self):
+        L = dstlib.LinkedList.from_iterable(range(100))
+        plain = dstlib.LinkedList()
+        I = dstlib.instrument(L, latency=True)
+        self.assertIs(dstlib.instrument(L), I)
+        self.assertIsInstance(L, dstlib.LinkedList)
+        seen = []
+        I.add_hook(lambda operation, structure, elapsed: seen.append((operation, structure)))
+        L.append(100)
+        p = L.add_last(101)
+        L.extend(range(3))
+        L.delete(p)
+        self.assertEqual(L[50], 50)
+        self.assertEqual(L[52], 52)
+        plain.append(1)
+        stats = I.stats()
+        self.assertEqual(stats["calls"], {"LinkedList.append": 1, "LinkedList.add_last": 1, "LinkedList.extend": 1,
+                                          "LinkedList.delete": 1, "LinkedList.__getitem__": 2})
+        self.assertEqual(stats["allocations"], 5)
+        self.assertEqual((stats["indexed_walks"], stats["nodes_traversed"], stats["max_traversal"]), (2, 52, 50))
+        self.assertEqual(sum(stats["latency_ns"]["LinkedList.__getitem__"].values()), 2)
+        self.assertEqual(seen[0], ("LinkedList.append", L))
+        self.assertEqual(len(seen), 6)
+        I.reset()
+        self.assertEqual(I.stats()["calls"], {})
+        self.assertIs(dstlib.uninstrument(L), I)
+        self.assertIs(type(L), dstlib.LinkedList)
+        L.append(0)
+        self.assertEqual(I.stats()["calls"], {})
+
+        G = dstlib.instrument_all()
+        try:
+            self.assertRaises(ValueError, dstlib.instrument_all)
+            Q = dstlib.Queue()
+            Q.enqueue_position(1)
+            Q.enqueue_many([2, 3])
+            self.assertEqual(Q.dequeue(), 1)
+            S = dstlib.Stack.from_iterable(range(4))
+            self.assertEqual(S.pop_many(2), [3, 2])
+        finally:
+            self.assertIs(dstlib.uninstrument_all(), G)
+        self.assertNotIn("enqueue", vars(dstlib.Queue))
+        stats = G.stats()
+        self.assertEqual(stats["calls"], {"Queue.enqueue_position": 1, "Queue.enqueue_many": 1, "Queue.dequeue": 1,
+                                          "Stack.push_many": 1, "Stack.pop_many": 1})
+        self.assertEqual(stats["allocations"], 7)
+        self.assertNotIn("latency_ns", stats)
+
+        G = dstlib.instrument_all()
+        try:
+            Q = dstlib.Queue()
+            Q.concat(dstlib.Queue.from_iterable(range(10)))
+            L = dstlib.LinkedList.from_iterable(range(3))
+            L.extend(range(2))
+        finally:
+            dstlib.uninstrument_all()
+        self.assertEqual(G.stats()["calls"]["Queue.concat"], 1)
+        self.assertEqual(G.stats()["allocations"], 25)
+
+        L = dstlib.LinkedList.from_iterable(range(5), indexed=True)
+        I = dstlib.instrument(L)
+        M = pickle.loads(pickle.dumps(L))
+        self.assertIs(type(M), dstlib.LinkedList)
+        self.assertEqual(list(M), list(range(5)))
+        self.assertEqual(M[3], 3)
+        self.assertIs(type(copy.copy(L)), dstlib.LinkedList)
+        self.assertEqual(I.stats()["calls"], {})
+
+        B = dstlib.BlockingQueue()
+        I = dstlib.instrument(B)
+        consumer = threading.Thread(target=B.get, daemon=True)
+        consumer.start()
+        consumer.join(timeout=0.05)
+        for i in range(3):
+            B.put(i)
+        consumer.join(timeout=5)
+        self.assertEqual(I.stats()["calls"], {"BlockingQueue.get": 1, "BlockingQueue.put": 3})
+
+
+class ExceptionsTest(unittest.TestCase):
+
+    def test_match(self):
+        Q = dstlib.Queue()
+        self.assertRaises(dstlib.Empty, Q.dequeue)
+        self.assertRaises(dstlib.Empty, Q.first)
+        self.assertIsNone(Q.dequeue_or())
+        self.assertEqual(Q.dequeue_or('none'), 'none')
+        self.assertEqual(Q.try_dequeue(), (False, None))
+        Q.enqueue(None)
+        Q.enqueue(2)
+        self.assertEqual(Q.try_dequeue(), (True, None))
+        self.assertEqual(Q.dequeue_or('none'), 2)
+
+        S = dstlib.Stack()
+        self.assertRaises(dstlib.Empty, S.pop)
+        self.assertEqual(S.pop_or(-1), -1)
+        self.assertEqual(S.try_pop(), (False, None))
+        S.push(1)
+        self.assertEqual(S.pop_or(-1), 1)
+
+        A = dstlib.ArrayQueue()
+        self.assertRaises(dstlib.Empty, A.dequeue)
+        self.assertEqual(A.dequeue_or(0), 0)
+        A.enqueue(5)
+        self.assertEqual(A.try_dequeue(), (True, 5))
+
+        B = dstlib.BlockingQueue()
+        self.assertRaises(dstlib.Empty, B.get, timeout=0.01)
+        self.assertEqual(B.try_dequeue(), (False, None))
+
+        L = dstlib.LinkedList()
+        L2 = dstlib.LinkedList()
+        p = L2.add_last(1)
+        L.concat(L2)
+        self.assertRaises(ValueError, L.delete, p)
+        self.assertRaises(ValueError, L2.delete, p)
+        self.assertRaises(dstlib.DstlibError, L2.delete, p)
+        self.assertRaises(TypeError, L.delete, Q.enqueue_position(1))
+        self.assertEqual(list(L), [1])
+
+
+
 class StackValuesTest(unittest.TestCase):
     
     def test_match(self):